@@ -18,8 +18,23 @@ from collections import deque, defaultdict
 from pathlib import Path
 from builtins import open  # Ensure built-in open function is available
 
+# xxhash is optional; state hashes only need to be stable dedup keys, not cryptographic
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+
+def _digest16(data: bytes) -> str:
+    """Return a 16-hex-character digest of data (xxh3_64 when available, else truncated MD5)."""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_hexdigest(data)
+    return hashlib.md5(data).hexdigest()[:16]
+
+
 class StateHasher:
     """Creates consistent hash representations of browser states."""
     
@@ -41,11 +56,11 @@ class StateHasher:
             state_str = json.dumps(state_elements, sort_keys=True)
             
             # Return hash
-            return hashlib.md5(state_str.encode()).hexdigest()[:16]
+            return _digest16(state_str.encode())
             
         except Exception as e:
             logger.warning(f"Error hashing state: {e}")
-            return hashlib.md5(str(time.time()).encode()).hexdigest()[:16]
+            return _digest16(str(time.time()).encode())
     
     @staticmethod
     def _extract_structure(axtree_txt: str) -> List[str]:
@@ -354,6 +369,44 @@ class EpisodicMemory:
         except Exception as e:
             logger.warning(f"Could not load memory: {e}")
     
+    def merge_memory(self, other: "EpisodicMemory", base: "EpisodicMemory", since: float):
+        """Merge what `other` learned after `since` into this memory.
+        
+        `other` started from `base` (e.g. a copy of its persistence file made at
+        `since`), so only its new episodes and the growth of its pattern counts
+        over `base` are added. Several memories that started from the same
+        `base` can be merged in turn.
+        """
+        base_success = base.success_patterns
+        base_failure = base.failure_patterns
+        base_strategies = base.domain_strategies
+        
+        for episode in other.episodes:
+            if episode['timestamp'] > since:
+                self.episodes.append(episode)
+        
+        touched = set()
+        for key, count in other.success_patterns.items():
+            self.success_patterns[key] += count - base_success.get(key, 0)
+            touched.add(key)
+        for key, count in other.failure_patterns.items():
+            self.failure_patterns[key] += count - base_failure.get(key, 0)
+            touched.add(key)
+        for domain, actions in other.domain_strategies.items():
+            for action, count in actions.items():
+                self.domain_strategies[domain][action] = (
+                    self.domain_strategies[domain].get(action, 0)
+                    + count - base_strategies.get(domain, {}).get(action, 0)
+                )
+        
+        for key in touched:
+            if key in other.state_action_outcomes:
+                self.state_action_outcomes[key] = {
+                    **other.state_action_outcomes[key],
+                    'success_rate': self._calculate_success_rate(key),
+                    'avg_time': self._calculate_avg_time(key)
+                }
+    
     def save_memory(self):
         """Save memory to persistence file."""
         try:
@@ -14,17 +14,30 @@ Date: 2025-06-15
 Version: 1.0
 """
 
+import sys
 import time
 import json
-from typing import Dict, List, Optional, Tuple, Any
+import functools
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
 import logging
 
+# Numba is optional; the scoring kernel falls back to plain Python without it
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Slotted dataclasses drop the per-instance __dict__; slots= needs Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 class PlanStatus(Enum):
     """Status enumeration for plan execution tracking."""
     PENDING = "pending"
@@ -33,7 +46,7 @@ class PlanStatus(Enum):
     FAILED = "failed"
     SKIPPED = "skipped"
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class SubGoal:
     """Represents a sub-goal in the hierarchical plan."""
     id: str
@@ -61,7 +74,7 @@ class SubGoal:
         data['status'] = PlanStatus(data['status'])
         return cls(**data)
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ActionPlan:
     """Detailed action plan for executing a sub-goal."""
     goal_id: str
@@ -84,12 +97,351 @@ class ActionPlan:
         """Create from dictionary."""
         return cls(**data)
 
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings, lists to tuples and intern strings."""
+    if isinstance(value, dict):
+        return MappingProxyType({sys.intern(k): _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+# Action strategies for each sub-goal type. Built lazily on first use, frozen
+# and shared by every planner instance.
+@functools.cache
+def _action_strategies() -> Mapping[str, Mapping]:
+    return _freeze({
+        'navigate_to_calendar': {
+            'actions': [
+                {
+                    'type': 'click',
+                    'target': 'calendar_link',
+                    'expected_outcome': 'calendar_page_loaded',
+                    'fallbacks': ['search_for_calendar', 'use_navigation_menu']
+                },
+                {
+                    'type': 'click',
+                    'target': 'nav_calendar',
+                    'expected_outcome': 'calendar_page_loaded',
+                    'fallbacks': ['search_for_calendar']
+                }
+            ]
+        },
+        'select_date_time': {
+            'actions': [
+                {
+                    'type': 'click',
+                    'target': 'date_picker',
+                    'expected_outcome': 'date_picker_opened',
+                    'fallbacks': ['click_calendar_date', 'type_date_manually']
+                },
+                {
+                    'type': 'click',
+                    'target': 'time_slot',
+                    'expected_outcome': 'time_selected',
+                    'fallbacks': ['type_time_manually']
+                }
+            ]
+        },
+        'create_event_form': {
+            'actions': [
+                {
+                    'type': 'click',
+                    'target': 'new_event_button',
+                    'expected_outcome': 'event_form_opened',
+                    'fallbacks': ['click_add_event', 'double_click_date']
+                }
+            ]
+        },
+        'fill_event_details': {
+            'actions': [
+                {
+                    'type': 'type',
+                    'target': 'event_title_field',
+                    'parameters': {'text': 'Meeting'},
+                    'expected_outcome': 'title_entered',
+                    'fallbacks': ['click_title_field_first']
+                },
+                {
+                    'type': 'type',
+                    'target': 'event_description_field',
+                    'parameters': {'text': 'Important meeting'},
+                    'expected_outcome': 'description_entered',
+                    'fallbacks': ['skip_description']
+                }
+            ]
+        },
+        'save_event': {
+            'actions': [
+                {
+                    'type': 'click',
+                    'target': 'save_button',
+                    'expected_outcome': 'event_saved',
+                    'fallbacks': ['click_create_button', 'press_enter']
+                }
+            ]
+        },
+        'navigate_to_compose': {
+            'actions': [
+                {
+                    'type': 'click',
+                    'target': 'compose_button',
+                    'expected_outcome': 'compose_window_opened',
+                    'fallbacks': ['click_new_message', 'use_keyboard_shortcut']
+                }
+            ]
+        },
+        'enter_recipient': {
+            'actions': [
+                {
+                    'type': 'type',
+                    'target': 'to_field',
+                    'parameters': {'text': 'recipient@example.com'},
+                    'expected_outcome': 'recipient_entered',
+                    'fallbacks': ['click_to_field_first']
+                }
+            ]
+        },
+        'enter_subject': {
+            'actions': [
+                {
+                    'type': 'type',
+                    'target': 'subject_field',
+                    'parameters': {'text': 'Important Message'},
+                    'expected_outcome': 'subject_entered',
+                    'fallbacks': ['click_subject_field_first']
+                }
+            ]
+        },
+        'compose_message': {
+            'actions': [
+                {
+                    'type': 'type',
+                    'target': 'message_body',
+                    'parameters': {'text': 'Hello, this is an important message.'},
+                    'expected_outcome': 'message_composed',
+                    'fallbacks': ['click_body_field_first']
+                }
+            ]
+        },
+        'send_email': {
+            'actions': [
+                {
+                    'type': 'click',
+                    'target': 'send_button',
+                    'expected_outcome': 'email_sent',
+                    'fallbacks': ['use_keyboard_shortcut', 'click_send_now']
+                }
+            ]
+        },
+        'search_for_person': {
+            'actions': [
+                {
+                    'type': 'type',
+                    'target': 'search_field',
+                    'parameters': {'text': 'John Doe'},
+                    'expected_outcome': 'search_results_displayed',
+                    'fallbacks': ['click_search_field_first']
+                }
+            ]
+        },
+        'view_profile': {
+            'actions': [
+                {
+                    'type': 'click',
+                    'target': 'profile_link',
+                    'expected_outcome': 'profile_page_loaded',
+                    'fallbacks': ['click_first_result']
+                }
+            ]
+        },
+        'initiate_connection': {
+            'actions': [
+                {
+                    'type': 'click',
+                    'target': 'connect_button',
+                    'expected_outcome': 'connection_request_sent',
+                    'fallbacks': ['click_add_friend', 'click_follow']
+                }
+            ]
+        },
+        'send_message': {
+            'actions': [
+                {
+                    'type': 'click',
+                    'target': 'message_button',
+                    'expected_outcome': 'message_window_opened',
+                    'fallbacks': ['click_send_message']
+                },
+                {
+                    'type': 'type',
+                    'target': 'message_field',
+                    'parameters': {'text': 'Hello! Nice to connect with you.'},
+                    'expected_outcome': 'message_typed',
+                    'fallbacks': ['click_message_field_first']
+                }
+            ]
+        },
+        'search_restaurants': {
+            'actions': [
+                {
+                    'type': 'type',
+                    'target': 'search_field',
+                    'parameters': {'text': 'Italian restaurant'},
+                    'expected_outcome': 'restaurant_results_displayed',
+                    'fallbacks': ['click_search_field_first']
+                }
+            ]
+        },
+        'select_restaurant': {
+            'actions': [
+                {
+                    'type': 'click',
+                    'target': 'restaurant_card',
+                    'expected_outcome': 'restaurant_details_loaded',
+                    'fallbacks': ['click_first_restaurant']
+                }
+            ]
+        },
+        'choose_date_time': {
+            'actions': [
+                {
+                    'type': 'click',
+                    'target': 'date_selector',
+                    'expected_outcome': 'date_picker_opened',
+                    'fallbacks': ['click_calendar_icon']
+                },
+                {
+                    'type': 'click',
+                    'target': 'time_slot',
+                    'expected_outcome': 'time_selected',
+                    'fallbacks': ['select_available_time']
+                }
+            ]
+        },
+        'enter_party_details': {
+            'actions': [
+                {
+                    'type': 'type',
+                    'target': 'party_size_field',
+                    'parameters': {'text': '4'},
+                    'expected_outcome': 'party_size_entered',
+                    'fallbacks': ['click_party_size_dropdown']
+                },
+                {
+                    'type': 'type',
+                    'target': 'special_requests_field',
+                    'parameters': {'text': 'Window table preferred'},
+                    'expected_outcome': 'special_requests_entered',
+                    'fallbacks': ['skip_special_requests']
+                }
+            ]
+        },
+        'confirm_reservation': {
+            'actions': [
+                {
+                    'type': 'click',
+                    'target': 'confirm_button',
+                    'expected_outcome': 'reservation_confirmed',
+                    'fallbacks': ['click_book_now', 'click_reserve']
+                }
+            ]
+        },
+        'analyze_page': {
+            'actions': [
+                {
+                    'type': 'observe',
+                    'target': 'page_content',
+                    'expected_outcome': 'page_structure_understood',
+                    'fallbacks': ['scroll_to_see_more']
+                }
+            ]
+        },
+        'identify_target_elements': {
+            'actions': [
+                {
+                    'type': 'scan',
+                    'target': 'interactive_elements',
+                    'expected_outcome': 'target_elements_identified',
+                    'fallbacks': ['search_for_keywords']
+                }
+            ]
+        },
+        'execute_primary_action': {
+            'actions': [
+                {
+                    'type': 'click',
+                    'target': 'primary_button',
+                    'expected_outcome': 'action_executed',
+                    'fallbacks': ['try_alternative_element']
+                }
+            ]
+        },
+        'verify_outcome': {
+            'actions': [
+                {
+                    'type': 'observe',
+                    'target': 'page_changes',
+                    'expected_outcome': 'outcome_verified',
+                    'fallbacks': ['wait_for_changes']
+                }
+            ]
+        }
+    })
+
+# Flattened dispatch table: sub-goal description -> candidate actions, so
+# resolution is a single lookup instead of strategy dict -> 'actions' key
+@functools.cache
+def _actions_by_sub_goal() -> Dict[str, Tuple[Mapping, ...]]:
+    return {name: strategy.get('actions', ()) for name, strategy in _action_strategies().items()}
+
+
+def _score_action_confidence(target_present: bool, reliable_type: bool, page_stable: bool) -> float:
+    """Numeric core of the action confidence score."""
+    base_confidence = 0.4
+    if target_present:
+        base_confidence += 0.4
+    if reliable_type:
+        base_confidence += 0.1
+    if page_stable:
+        base_confidence += 0.1
+    return min(1.0, base_confidence)
+
+if NUMBA_AVAILABLE:
+    _score_action_confidence = njit(cache=True)(_score_action_confidence)
+
+
+def _is_action_applicable(action_option: Mapping, elements: FrozenSet[str]) -> bool:
+    """Check if action is applicable given the lowercased page elements."""
+    target = action_option.get('target', '').lower()
+    
+    # Check if target element exists or similar elements exist
+    if any(target in element for element in elements):
+        return True
+    
+    # Check for semantic similarity
+    target_keywords = target.split('_')
+    for element in elements:
+        if any(keyword in element for keyword in target_keywords):
+            return True
+    
+    return False
+
+@functools.lru_cache(maxsize=512)
+def _resolve_action_option(description: str, elements: FrozenSet[str]) -> Optional[Mapping]:
+    """Return the first applicable action option for a sub-goal, memoized per page state."""
+    for action_option in _actions_by_sub_goal().get(description, ()):
+        if _is_action_applicable(action_option, elements):
+            return action_option
+    return None
+
+
 class HierarchicalPlanner:
     """Advanced hierarchical task planning system."""
     
     def __init__(self, persistence_file: str = "planning_memory.json"):
         self.goal_templates = self._initialize_goal_templates()
-        self.action_strategies = self._initialize_action_strategies()
         self.current_plan: Optional[List[SubGoal]] = None
         self.execution_history: List[Dict] = []
         self.persistence_file = persistence_file
@@ -104,13 +456,18 @@ class HierarchicalPlanner:
         }
         self._load_persistence()
     
+    @property
+    def action_strategies(self) -> Mapping[str, Mapping]:
+        """Shared, read-only action strategies (built on first access)."""
+        return _action_strategies()
+    
     def create_plan(self, goal_description: str, domain: str, current_state: Dict) -> List[SubGoal]:
         """Create a hierarchical plan for achieving the goal."""
-        logger.info(f"Creating plan for goal: {goal_description} in domain: {domain}")
+        logger.info("Creating plan for goal: %s in domain: %s", goal_description, domain)
         
         # Identify goal type
         goal_type = self._classify_goal(goal_description, domain)
-        logger.info(f"Classified goal type: {goal_type}")
+        logger.info("Classified goal type: %s", goal_type)
         
         # Get template for this goal type
         template = self.goal_templates.get(goal_type, self.goal_templates['default'])
@@ -136,35 +493,35 @@ class HierarchicalPlanner:
         self.current_plan = sub_goals
         self._save_persistence()
         
-        logger.info(f"Created plan with {len(sub_goals)} sub-goals")
+        logger.info("Created plan with %d sub-goals", len(sub_goals))
         return sub_goals
     
     def get_next_action_plan(self, current_state: Dict, sub_goal: SubGoal) -> Optional[ActionPlan]:
         """Generate detailed action plan for current sub-goal."""
-        logger.info(f"Generating action plan for sub-goal: {sub_goal.description}")
+        logger.info("Generating action plan for sub-goal: %s", sub_goal.description)
         
-        strategy = self.action_strategies.get(sub_goal.description, {})
-        if not strategy:
-            logger.warning(f"No strategy found for sub-goal: {sub_goal.description}")
+        if sub_goal.description not in _actions_by_sub_goal():
+            logger.warning("No strategy found for sub-goal: %s", sub_goal.description)
             return None
         
         # Select best action based on current state
-        for action_option in strategy.get('actions', []):
-            if self._is_action_applicable(action_option, current_state):
-                action_plan = ActionPlan(
-                    goal_id=sub_goal.id,
-                    action_type=action_option['type'],
-                    target_element=action_option['target'],
-                    parameters=action_option.get('parameters', {}),
-                    expected_outcome=action_option['expected_outcome'],
-                    confidence=self._calculate_action_confidence(action_option, current_state),
-                    fallback_actions=action_option.get('fallbacks', [])
-                )
-                logger.info(f"Generated action plan: {action_plan.action_type} on {action_plan.target_element}")
-                return action_plan
-        
-        logger.warning(f"No applicable action found for sub-goal: {sub_goal.description}")
-        return None
+        elements = frozenset(str(elem).lower() for elem in current_state.get('elements', []))
+        action_option = _resolve_action_option(sub_goal.description, elements)
+        if action_option is None:
+            logger.warning("No applicable action found for sub-goal: %s", sub_goal.description)
+            return None
+        
+        action_plan = ActionPlan(
+            goal_id=sub_goal.id,
+            action_type=action_option['type'],
+            target_element=action_option['target'],
+            parameters=dict(action_option.get('parameters', {})),
+            expected_outcome=action_option['expected_outcome'],
+            confidence=self._calculate_action_confidence(action_option, current_state),
+            fallback_actions=list(action_option.get('fallbacks', ()))
+        )
+        logger.info("Generated action plan: %s on %s", action_plan.action_type, action_plan.target_element)
+        return action_plan
     
     def update_plan_progress(self, sub_goal_id: str, success: bool, actual_steps: int, 
                            error_message: Optional[str] = None):
@@ -186,7 +543,7 @@ class HierarchicalPlanner:
                         self.plan_metrics['common_failure_patterns'][failure_type] = 0
                     self.plan_metrics['common_failure_patterns'][failure_type] += 1
                 
-                logger.info(f"Updated sub-goal {sub_goal_id}: {'SUCCESS' if success else 'FAILED'}")
+                logger.info("Updated sub-goal %s: %s", sub_goal_id, 'SUCCESS' if success else 'FAILED')
                 break
         
         self._save_persistence()
@@ -234,7 +591,7 @@ class HierarchicalPlanner:
         
         # Analyze failure patterns
         failure_analysis = self._analyze_failures(failed_plan)
-        logger.info(f"Failure analysis: {failure_analysis}")
+        logger.info("Failure analysis: %s", failure_analysis)
         
         # Get alternative strategy
         alternative_strategy = self._get_alternative_strategy(
@@ -242,7 +599,7 @@ class HierarchicalPlanner:
         )
         
         if alternative_strategy:
-            logger.info(f"Using alternative strategy: {alternative_strategy}")
+            logger.info("Using alternative strategy: %s", alternative_strategy)
             return self.create_plan(alternative_strategy, domain, current_state)
         
         # Fallback: simplify original plan
@@ -322,44 +679,17 @@ class HierarchicalPlanner:
         
         return sub_goals
     
-    def _is_action_applicable(self, action_option: Dict, current_state: Dict) -> bool:
-        """Check if action is applicable in current state."""
-        target = action_option.get('target', '').lower()
-        elements = [str(elem).lower() for elem in current_state.get('elements', [])]
-        
-        # Check if target element exists or similar elements exist
-        if any(target in element for element in elements):
-            return True
-        
-        # Check for semantic similarity
-        target_keywords = target.split('_')
-        for element in elements:
-            if any(keyword in element for keyword in target_keywords):
-                return True
-        
-        return False
-    
-    def _calculate_action_confidence(self, action_option: Dict, current_state: Dict) -> float:
+    def _calculate_action_confidence(self, action_option: Mapping, current_state: Dict) -> float:
         """Calculate confidence for action based on current state."""
-        base_confidence = 0.4
-        
         target = action_option.get('target', '').lower()
         elements = [str(elem).lower() for elem in current_state.get('elements', [])]
         
-        # Increase confidence if target element is clearly present
-        if any(target in element for element in elements):
-            base_confidence += 0.4
-        
-        # Increase confidence based on action type reliability
-        action_type = action_option.get('type', '')
-        if action_type in ['click', 'type']:
-            base_confidence += 0.1
-        
-        # Consider page stability
-        if current_state.get('page_stable', True):
-            base_confidence += 0.1
-        
-        return min(1.0, base_confidence)
+        # Target element clearly present, reliable action type, stable page
+        return _score_action_confidence(
+            any(target in element for element in elements),
+            action_option.get('type', '') in ('click', 'type'),
+            bool(current_state.get('page_stable', True)),
+        )
     
     def _analyze_failures(self, failed_plan: List[SubGoal]) -> Dict:
         """Analyze failure patterns in the plan."""
@@ -461,7 +791,7 @@ class HierarchicalPlanner:
             with open(self.persistence_file, 'w') as f:
                 json.dump(data, f, indent=2)
         except Exception as e:
-            logger.error(f"Failed to save planning persistence: {e}")
+            logger.error("Failed to save planning persistence: %s", e)
     
     def _load_persistence(self):
         """Load planning state from persistence file."""
@@ -479,7 +809,7 @@ class HierarchicalPlanner:
         except FileNotFoundError:
             logger.info("No planning persistence file found, starting fresh")
         except Exception as e:
-            logger.error(f"Failed to load planning persistence: {e}")
+            logger.error("Failed to load planning persistence: %s", e)
     
     def _initialize_goal_templates(self) -> Dict[str, Dict]:
         """Initialize goal decomposition templates."""
@@ -698,287 +1028,6 @@ class HierarchicalPlanner:
                 ]
             }
         }
-    
-    def _initialize_action_strategies(self) -> Dict[str, Dict]:
-        """Initialize action strategies for each sub-goal type."""
-        return {
-            'navigate_to_calendar': {
-                'actions': [
-                    {
-                        'type': 'click',
-                        'target': 'calendar_link',
-                        'expected_outcome': 'calendar_page_loaded',
-                        'fallbacks': ['search_for_calendar', 'use_navigation_menu']
-                    },
-                    {
-                        'type': 'click',
-                        'target': 'nav_calendar',
-                        'expected_outcome': 'calendar_page_loaded',
-                        'fallbacks': ['search_for_calendar']
-                    }
-                ]
-            },
-            'select_date_time': {
-                'actions': [
-                    {
-                        'type': 'click',
-                        'target': 'date_picker',
-                        'expected_outcome': 'date_picker_opened',
-                        'fallbacks': ['click_calendar_date', 'type_date_manually']
-                    },
-                    {
-                        'type': 'click',
-                        'target': 'time_slot',
-                        'expected_outcome': 'time_selected',
-                        'fallbacks': ['type_time_manually']
-                    }
-                ]
-            },
-            'create_event_form': {
-                'actions': [
-                    {
-                        'type': 'click',
-                        'target': 'new_event_button',
-                        'expected_outcome': 'event_form_opened',
-                        'fallbacks': ['click_add_event', 'double_click_date']
-                    }
-                ]
-            },
-            'fill_event_details': {
-                'actions': [
-                    {
-                        'type': 'type',
-                        'target': 'event_title_field',
-                        'parameters': {'text': 'Meeting'},
-                        'expected_outcome': 'title_entered',
-                        'fallbacks': ['click_title_field_first']
-                    },
-                    {
-                        'type': 'type',
-                        'target': 'event_description_field',
-                        'parameters': {'text': 'Important meeting'},
-                        'expected_outcome': 'description_entered',
-                        'fallbacks': ['skip_description']
-                    }
-                ]
-            },
-            'save_event': {
-                'actions': [
-                    {
-                        'type': 'click',
-                        'target': 'save_button',
-                        'expected_outcome': 'event_saved',
-                        'fallbacks': ['click_create_button', 'press_enter']
-                    }
-                ]
-            },
-            'navigate_to_compose': {
-                'actions': [
-                    {
-                        'type': 'click',
-                        'target': 'compose_button',
-                        'expected_outcome': 'compose_window_opened',
-                        'fallbacks': ['click_new_message', 'use_keyboard_shortcut']
-                    }
-                ]
-            },
-            'enter_recipient': {
-                'actions': [
-                    {
-                        'type': 'type',
-                        'target': 'to_field',
-                        'parameters': {'text': 'recipient@example.com'},
-                        'expected_outcome': 'recipient_entered',
-                        'fallbacks': ['click_to_field_first']
-                    }
-                ]
-            },
-            'enter_subject': {
-                'actions': [
-                    {
-                        'type': 'type',
-                        'target': 'subject_field',
-                        'parameters': {'text': 'Important Message'},
-                        'expected_outcome': 'subject_entered',
-                        'fallbacks': ['click_subject_field_first']
-                    }
-                ]
-            },
-            'compose_message': {
-                'actions': [
-                    {
-                        'type': 'type',
-                        'target': 'message_body',
-                        'parameters': {'text': 'Hello, this is an important message.'},
-                        'expected_outcome': 'message_composed',
-                        'fallbacks': ['click_body_field_first']
-                    }
-                ]
-            },
-            'send_email': {
-                'actions': [
-                    {
-                        'type': 'click',
-                        'target': 'send_button',
-                        'expected_outcome': 'email_sent',
-                        'fallbacks': ['use_keyboard_shortcut', 'click_send_now']
-                    }
-                ]
-            },
-            'search_for_person': {
-                'actions': [
-                    {
-                        'type': 'type',
-                        'target': 'search_field',
-                        'parameters': {'text': 'John Doe'},
-                        'expected_outcome': 'search_results_displayed',
-                        'fallbacks': ['click_search_field_first']
-                    }
-                ]
-            },
-            'view_profile': {
-                'actions': [
-                    {
-                        'type': 'click',
-                        'target': 'profile_link',
-                        'expected_outcome': 'profile_page_loaded',
-                        'fallbacks': ['click_first_result']
-                    }
-                ]
-            },
-            'initiate_connection': {
-                'actions': [
-                    {
-                        'type': 'click',
-                        'target': 'connect_button',
-                        'expected_outcome': 'connection_request_sent',
-                        'fallbacks': ['click_add_friend', 'click_follow']
-                    }
-                ]
-            },
-            'send_message': {
-                'actions': [
-                    {
-                        'type': 'click',
-                        'target': 'message_button',
-                        'expected_outcome': 'message_window_opened',
-                        'fallbacks': ['click_send_message']
-                    },
-                    {
-                        'type': 'type',
-                        'target': 'message_field',
-                        'parameters': {'text': 'Hello! Nice to connect with you.'},
-                        'expected_outcome': 'message_typed',
-                        'fallbacks': ['click_message_field_first']
-                    }
-                ]
-            },
-            'search_restaurants': {
-                'actions': [
-                    {
-                        'type': 'type',
-                        'target': 'search_field',
-                        'parameters': {'text': 'Italian restaurant'},
-                        'expected_outcome': 'restaurant_results_displayed',
-                        'fallbacks': ['click_search_field_first']
-                    }
-                ]
-            },
-            'select_restaurant': {
-                'actions': [
-                    {
-                        'type': 'click',
-                        'target': 'restaurant_card',
-                        'expected_outcome': 'restaurant_details_loaded',
-                        'fallbacks': ['click_first_restaurant']
-                    }
-                ]
-            },
-            'choose_date_time': {
-                'actions': [
-                    {
-                        'type': 'click',
-                        'target': 'date_selector',
-                        'expected_outcome': 'date_picker_opened',
-                        'fallbacks': ['click_calendar_icon']
-                    },
-                    {
-                        'type': 'click',
-                        'target': 'time_slot',
-                        'expected_outcome': 'time_selected',
-                        'fallbacks': ['select_available_time']
-                    }
-                ]
-            },
-            'enter_party_details': {
-                'actions': [
-                    {
-                        'type': 'type',
-                        'target': 'party_size_field',
-                        'parameters': {'text': '4'},
-                        'expected_outcome': 'party_size_entered',
-                        'fallbacks': ['click_party_size_dropdown']
-                    },
-                    {
-                        'type': 'type',
-                        'target': 'special_requests_field',
-                        'parameters': {'text': 'Window table preferred'},
-                        'expected_outcome': 'special_requests_entered',
-                        'fallbacks': ['skip_special_requests']
-                    }
-                ]
-            },
-            'confirm_reservation': {
-                'actions': [
-                    {
-                        'type': 'click',
-                        'target': 'confirm_button',
-                        'expected_outcome': 'reservation_confirmed',
-                        'fallbacks': ['click_book_now', 'click_reserve']
-                    }
-                ]
-            },
-            'analyze_page': {
-                'actions': [
-                    {
-                        'type': 'observe',
-                        'target': 'page_content',
-                        'expected_outcome': 'page_structure_understood',
-                        'fallbacks': ['scroll_to_see_more']
-                    }
-                ]
-            },
-            'identify_target_elements': {
-                'actions': [
-                    {
-                        'type': 'scan',
-                        'target': 'interactive_elements',
-                        'expected_outcome': 'target_elements_identified',
-                        'fallbacks': ['search_for_keywords']
-                    }
-                ]
-            },
-            'execute_primary_action': {
-                'actions': [
-                    {
-                        'type': 'click',
-                        'target': 'primary_button',
-                        'expected_outcome': 'action_executed',
-                        'fallbacks': ['try_alternative_element']
-                    }
-                ]
-            },
-            'verify_outcome': {
-                'actions': [
-                    {
-                        'type': 'observe',
-                        'target': 'page_changes',
-                        'expected_outcome': 'outcome_verified',
-                        'fallbacks': ['wait_for_changes']
-                    }
-                ]
-            }
-        }
 
 # Example usage and testing
 if __name__ == "__main__":
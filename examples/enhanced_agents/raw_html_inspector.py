@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 
 import re
+import sys
+from itertools import islice
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -9,11 +11,22 @@ from agisdk.REAL.browsergym.experiments import EnvArgs, ExpArgs, get_exp_result,
 from agisdk.REAL.browsergym.experiments.loop import ExpResult, yield_all_exp_results
 from agisdk.REAL.browsergym.experiments.agent import Agent
 
+# Byte patterns run case-insensitively on the UTF-8 payload as-is, so the
+# printed matches are the original slices
+_BID_RE = re.compile(rb'bid="([^"]*)"', re.IGNORECASE)
+_INPUT_RE = re.compile(rb'<input[^>]*>', re.IGNORECASE)
+_HTML_MARKER_RE = re.compile(rb'<html|<body|bid=', re.IGNORECASE)
+
+# Only the largest string values can hold a DOM; small metadata is skipped
+_MAX_SCAN_VALUES = 2
+_MIN_DOM_LEN = 256
+
 
 @dataclass
 class RawHtmlInspectorArgs(AbstractAgentArgs):
     """Arguments for the raw HTML inspector agent."""
     agent_name: str = "RawHtmlInspector"
+    verbose: bool = True
     
     def make_agent(self):
         """Create the agent instance."""
@@ -46,96 +59,108 @@ class RawHtmlInspector(Agent):
     def get_action(self, obs: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
         """Get the next action to take."""
         self.step_count += 1
+        out: List[str] = []
         
         # Extract information from observation
         url = obs.get('url', 'Unknown')
         goal = obs.get('goal', 'No goal specified')
         
-        print(f"\n{'='*80}")
-        print(f"STEP {self.step_count}: RAW HTML INSPECTION")
-        print(f"{'='*80}")
-        print(f"URL: {url}")
-        print(f"Goal: {goal}")
+        if self.args.verbose:
+            out.append(f"\n{'='*80}")
+            out.append(f"STEP {self.step_count}: RAW HTML INSPECTION")
+            out.append(f"{'='*80}")
+            out.append(f"URL: {url}")
+            out.append(f"Goal: {goal}")
         
-        # Print all observation keys
-        print(f"\nObservation keys: {list(obs.keys())}")
+            # Print all observation keys
+            out.append(f"\nObservation keys: {list(obs.keys())}")
         
-        # Print DOM-related information
-        if 'dom_txt' in obs:
-            dom_txt = obs['dom_txt']
-            print(f"\nDOM_TXT (first 2000 chars):")
-            print("-" * 40)
-            print(dom_txt[:2000])
-            print("-" * 40)
+            # Print DOM-related information
+            if 'dom_txt' in obs:
+                dom_txt = obs['dom_txt']
+                out.append(f"\nDOM_TXT (first 2000 chars):")
+                out.append("-" * 40)
+                out.append(str(dom_txt[:2000]))
+                out.append("-" * 40)
             
-        if 'dom_object' in obs:
-            dom_obj = obs['dom_object']
-            print(f"\nDOM_OBJECT type: {type(dom_obj)}")
-            if isinstance(dom_obj, dict):
-                print(f"DOM_OBJECT keys: {list(dom_obj.keys())}")
+            if 'dom_object' in obs:
+                dom_obj = obs['dom_object']
+                out.append(f"\nDOM_OBJECT type: {type(dom_obj)}")
+                if isinstance(dom_obj, dict):
+                    out.append(f"DOM_OBJECT keys: {list(dom_obj.keys())}")
                 
-        # Print accessibility tree
-        if 'axtree_txt' in obs:
-            axtree_txt = obs['axtree_txt']
-            print(f"\nAXTREE_TXT (first 1000 chars):")
-            print("-" * 40)
-            print(axtree_txt[:1000])
-            print("-" * 40)
+            # Print accessibility tree
+            if 'axtree_txt' in obs:
+                axtree_txt = obs['axtree_txt']
+                out.append(f"\nAXTREE_TXT (first 1000 chars):")
+                out.append("-" * 40)
+                out.append(str(axtree_txt[:1000]))
+                out.append("-" * 40)
             
-        if 'axtree_object' in obs:
-            axtree_obj = obs['axtree_object']
-            print(f"\nAXTREE_OBJECT type: {type(axtree_obj)}")
-            if isinstance(axtree_obj, dict):
-                print(f"AXTREE_OBJECT keys: {list(axtree_obj.keys())}")
-        
-        # Look for any HTML content
-        html_content = None
-        for key, value in obs.items():
-            if isinstance(value, str) and ('<html' in value.lower() or '<body' in value.lower() or 'bid=' in value.lower()):
-                html_content = value
-                print(f"\nFound HTML content in key '{key}' (first 3000 chars):")
-                print("-" * 40)
-                print(value[:3000])
-                print("-" * 40)
-                break
-                
-        # Search for bid attributes in any string values
-        bid_count = 0
-        for key, value in obs.items():
-            if isinstance(value, str):
-                bids = re.findall(r'bid="([^"]*)"', value, re.IGNORECASE)
-                if bids:
-                    bid_count += len(bids)
-                    print(f"\nFound {len(bids)} BID attributes in '{key}':")
-                    for i, bid in enumerate(bids[:10]):  # Show first 10
-                        print(f"  {i+1}. bid=\"{bid}\"")
-                    if len(bids) > 10:
-                        print(f"  ... and {len(bids) - 10} more")
-                        
-        print(f"\nTotal BID attributes found: {bid_count}")
+            if 'axtree_object' in obs:
+                axtree_obj = obs['axtree_object']
+                out.append(f"\nAXTREE_OBJECT type: {type(axtree_obj)}")
+                if isinstance(axtree_obj, dict):
+                    out.append(f"AXTREE_OBJECT keys: {list(axtree_obj.keys())}")
         
-        # Search for input elements
-        input_count = 0
-        for key, value in obs.items():
-            if isinstance(value, str):
-                inputs = re.findall(r'<input[^>]*>', value, re.IGNORECASE)
-                if inputs:
-                    input_count += len(inputs)
-                    print(f"\nFound {len(inputs)} input elements in '{key}':")
-                    for i, inp in enumerate(inputs[:5]):  # Show first 5
-                        print(f"  {i+1}. {inp}")
-                    if len(inputs) > 5:
-                        print(f"  ... and {len(inputs) - 5} more")
+            # Single pass over the largest observation values: HTML sniff, BID and input scans
+            html_content = None
+            bid_count = 0
+            input_count = 0
+            candidates = sorted(
+                ((k, v) for k, v in obs.items() if type(v) is str and len(v) >= _MIN_DOM_LEN),
+                key=lambda kv: -len(kv[1]),
+            )[:_MAX_SCAN_VALUES]
+            for key, value in candidates:
+                b = value.encode('utf-8', 'ignore')
+            
+                if html_content is None and _HTML_MARKER_RE.search(b) is not None:
+                    html_content = value
+                    out.append(f"\nFound HTML content in key '{key}' (first 3000 chars):")
+                    out.append("-" * 40)
+                    out.append(value[:3000])
+                    out.append("-" * 40)
+            
+                # finditer + islice materializes just the displayed matches and counts the rest
+                matches = _BID_RE.finditer(b)
+                shown = list(islice(matches, 10))  # Show first 10
+                n_bids = len(shown) + sum(1 for _ in matches)
+                if n_bids:
+                    bid_count += n_bids
+                    out.append(f"\nFound {n_bids} BID attributes in '{key}':")
+                    for i, m in enumerate(shown):
+                        out.append(f"  {i+1}. bid=\"{m.group(1).decode('utf-8', 'replace')}\"")
+                    if n_bids > 10:
+                        out.append(f"  ... and {n_bids - 10} more")
+            
+                matches = _INPUT_RE.finditer(b)
+                shown = list(islice(matches, 5))  # Show first 5
+                n_inputs = len(shown) + sum(1 for _ in matches)
+                if n_inputs:
+                    input_count += n_inputs
+                    out.append(f"\nFound {n_inputs} input elements in '{key}':")
+                    for i, m in enumerate(shown):
+                        out.append(f"  {i+1}. {m.group(0).decode('utf-8', 'replace')}")
+                    if n_inputs > 5:
+                        out.append(f"  ... and {n_inputs - 5} more")
                         
-        print(f"\nTotal input elements found: {input_count}")
+            out.append(f"\nTotal BID attributes found: {bid_count}")
+            out.append(f"\nTotal input elements found: {input_count}")
         
         # Try simple actions based on step
         if self.step_count <= 3:
-            print(f"\nTaking scroll action for step {self.step_count}")
-            return 'scroll(0, 3)', {}
+            out.append(f"\nTaking scroll action for step {self.step_count}")
+            action = 'scroll(0, 3)'
         else:
-            print(f"\nEnding inspection after {self.step_count} steps")
-            return 'send_msg_to_user("HTML inspection complete")', {}
+            out.append(f"\nEnding inspection after {self.step_count} steps")
+            action = 'send_msg_to_user("HTML inspection complete")'
+        
+        # Emit the whole report with a single write instead of one print per line;
+        # the trailing empty entry supplies the final newline without another copy
+        if self.args.verbose:
+            out.append('')
+            sys.stdout.write('\n'.join(out))
+        return action, {}
 
 
 def test_raw_html_inspector():
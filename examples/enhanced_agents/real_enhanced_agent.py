@@ -5,8 +5,14 @@ Integrates all enhanced components with the REAL benchmark framework.
 """
 
 import dataclasses
+import functools
+import hashlib
 import json
+import logging
+import re
+import sys
 import time
+from collections import deque, namedtuple
 from typing import Optional, Dict, Any, List
 from pathlib import Path
 
@@ -21,7 +27,236 @@ from self_critique import SelfCritiqueSystem
 from planning_system import HierarchicalPlanner
 from advanced_retry_system import AdvancedRetrySystem, RetryConfig
 
-@dataclasses.dataclass
+# pyahocorasick is optional; without it keyword detection uses plain substring checks
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# slots=True needs Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# One entry of the agent's action history
+ActionRecord = namedtuple('ActionRecord', 'action state_hash timestamp confidence recommendation')
+
+# Observation fields the agent expects on every step
+_REQUIRED_OBS_FIELDS = ('screenshot',)
+
+# Page-element keywords scanned in DOM/AXTree text
+_BUTTON_KEYWORDS = ('button', 'btn', 'submit', 'buy now', 'add to cart', 'search', 'login', 'sign in')
+_INPUT_KEYWORDS = ('input', 'textbox', 'search', 'email', 'password', 'name', 'address')
+_PAGE_KEYWORDS = frozenset(_BUTTON_KEYWORDS + _INPUT_KEYWORDS + ('link', '<a', 'form'))
+
+# Goal analysis patterns. Intent keywords map to intents listed in priority
+# order; one alternation scan finds every keyword and the highest-priority
+# intent wins, matching the original if/elif precedence.
+_INTENT_MAP = {
+    'search': 'search', 'find': 'search',
+    'buy': 'purchase', 'purchase': 'purchase',
+    'compare': 'compare',
+    'login': 'login', 'sign in': 'login',
+    'fill': 'form_fill', 'enter': 'form_fill',
+    'click': 'click',
+    'navigate': 'navigate', 'go to': 'navigate',
+}
+_INTENT_PRIORITY = {intent: rank for rank, intent in enumerate(dict.fromkeys(_INTENT_MAP.values()))}
+_INTENT_RE = re.compile('|'.join(re.escape(keyword) for keyword in _INTENT_MAP))
+_PRODUCT_KEYWORDS = ('playstation', 'dualsense', 'samsung', 'galaxy', 'iphone', 'laptop', 'espresso', 'machine')
+_PRODUCT_PRIORITY = {keyword: rank for rank, keyword in enumerate(_PRODUCT_KEYWORDS)}
+_PRODUCT_RE = re.compile('|'.join(re.escape(keyword) for keyword in _PRODUCT_KEYWORDS))
+_CARD_RE = re.compile(r'\d{4}\s*\d{4}\s*\d{4}\s*\d{4}')
+_NAME_RE = re.compile(r'name:\s*([^,\n]+)', re.IGNORECASE)
+
+# Maximum number of page-key -> (action, critique) entries kept per agent
+_ACTION_CACHE_SIZE = 1024
+
+# Only the tail of the action/error history is ever read
+_HISTORY_SIZE = 64
+
+if AHOCORASICK_AVAILABLE:
+    _PAGE_KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _PAGE_KEYWORDS:
+        _PAGE_KEYWORD_AUTOMATON.add_word(_keyword, _keyword)
+    _PAGE_KEYWORD_AUTOMATON.make_automaton()
+
+def _find_page_keywords(text: str) -> frozenset:
+    """Return the page keywords occurring in `text` (already lowercased)."""
+    if not AHOCORASICK_AVAILABLE:
+        return frozenset(keyword for keyword in _PAGE_KEYWORDS if keyword in text)
+    
+    # Single DFA pass over the text; stop once every keyword has been seen
+    found = set()
+    for _, keyword in _PAGE_KEYWORD_AUTOMATON.iter(text):
+        found.add(keyword)
+        if len(found) == len(_PAGE_KEYWORDS):
+            break
+    return frozenset(found)
+
+def _goal_from_dict(goal_object: dict) -> str:
+    # Standard dict format: {'utterance': 'goal text'}
+    return goal_object.get('utterance', '')
+
+def _goal_from_list(goal_object: list) -> str:
+    # OpenAI-style message format: [{'role': 'user', 'content': 'goal text'}]
+    if not goal_object:
+        return ''
+    for msg in goal_object:
+        if isinstance(msg, dict) and msg.get('role') == 'user':
+            return msg.get('content', '')
+    # Fallback to first message content
+    first_msg = goal_object[0]
+    if isinstance(first_msg, dict):
+        return first_msg.get('content', first_msg.get('utterance', ''))
+    return str(first_msg)
+
+# Goal extraction dispatch on the exact goal_object type; other types yield ''
+_GOAL_EXTRACTORS = {
+    dict: _goal_from_dict,
+    list: _goal_from_list,
+    str: lambda goal_object: goal_object,
+}
+
+@functools.lru_cache(maxsize=4)
+def _get_action_set(subsets: tuple, strict: bool, multiaction: bool, demo_mode: str) -> HighLevelActionSet:
+    """Build the action set once per configuration; it is immutable and shared by agents."""
+    try:
+        return HighLevelActionSet(
+            subsets=list(subsets),
+            strict=strict,
+            multiaction=multiaction,
+            demo_mode=demo_mode
+        )
+    except TypeError:
+        return HighLevelActionSet()
+
+@functools.lru_cache(maxsize=256)
+def _analyze_goal_cached(goal: str) -> dict:
+    """Analyze goal to extract actionable intent and targets.
+    
+    The goal string is usually identical on every step of an episode, so the
+    analysis is memoized; callers must not mutate the returned dict.
+    """
+    goal_lower = goal.lower()
+    
+    analysis = {
+        'intent': 'unknown',
+        'target_item': '',
+        'action_type': 'navigate',
+        'specific_actions': [],
+        'payment_info': {},
+        'search_terms': []
+    }
+    
+    # Identify primary intent
+    intents = {_INTENT_MAP[keyword] for keyword in _INTENT_RE.findall(goal_lower)}
+    if intents:
+        analysis['intent'] = min(intents, key=_INTENT_PRIORITY.__getitem__)
+    
+    # Extract target items/products
+    products = _PRODUCT_RE.findall(goal_lower)
+    if products:
+        keyword = min(products, key=_PRODUCT_PRIORITY.__getitem__)
+        analysis['target_item'] = keyword
+        analysis['search_terms'].append(keyword)
+    
+    # Extract payment information if present
+    if 'payment' in goal_lower or 'card' in goal_lower:
+        # Look for card numbers, names, etc.
+        card_match = _CARD_RE.search(goal)
+        if card_match:
+            analysis['payment_info']['card_number'] = card_match.group()
+        
+        name_match = _NAME_RE.search(goal)
+        if name_match:
+            analysis['payment_info']['name'] = name_match.group(1).strip()
+    
+    # Extract specific action sequences
+    if 'first result' in goal_lower:
+        analysis['specific_actions'].append('click_first_result')
+    if 'buy now' in goal_lower:
+        analysis['specific_actions'].append('click_buy_now')
+    if 'change' in goal_lower and 'payment' in goal_lower:
+        analysis['specific_actions'].append('change_payment_method')
+    
+    return analysis
+
+def _handle_search(goal_analysis: dict, elements: dict) -> str:
+    target_item = goal_analysis['target_item']
+    if target_item and elements['search_boxes']:
+        return f"fill('search', '{target_item}')"
+    elif elements['search_boxes']:
+        return "fill('search', 'product')"
+    elif elements['inputs']:
+        return f"fill('input', '{target_item}')" if target_item else "fill('input', 'search term')"
+    return "goto('/')"  # Navigate to home page to find search
+
+def _handle_purchase(goal_analysis: dict, elements: dict) -> str:
+    if 'click_buy_now' in goal_analysis['specific_actions'] and elements['buttons']:
+        # Look for buy now button specifically
+        if any('buy' in btn for btn in elements['buttons']):
+            return "click('Buy Now')"
+        return "click('button')"
+    elif elements['buttons']:
+        return "click('Add to Cart')"
+    return "noop()"  # Wait for page to load
+
+def _handle_compare(goal_analysis: dict, elements: dict) -> str:
+    if goal_analysis['target_item']:
+        return "goto('https://omnizon.com')"  # Start at main site
+    return "goto('/')"
+
+def _handle_click(goal_analysis: dict, elements: dict) -> str:
+    if 'click_first_result' in goal_analysis['specific_actions']:
+        return "click('first')"
+    elif elements['buttons']:
+        return "click('button')"
+    elif elements['links']:
+        return "click('link')"
+    return "click('element')"
+
+def _handle_form_fill(goal_analysis: dict, elements: dict) -> str:
+    payment_info = goal_analysis.get('payment_info', {})
+    if payment_info and 'name' in payment_info:
+        return f"fill('name', '{payment_info['name']}')"
+    elif payment_info and 'card_number' in payment_info:
+        return f"fill('card', '{payment_info['card_number']}')"
+    elif elements['inputs']:
+        return "fill('input', 'information')"
+    return "noop()"
+
+def _handle_navigate(goal_analysis: dict, elements: dict) -> str:
+    target_item = goal_analysis['target_item']
+    if target_item:
+        return f"goto('/{target_item}')"
+    return "goto('/')"
+
+def _handle_default(goal_analysis: dict, elements: dict) -> str:
+    """Fallback action based on available elements."""
+    target_item = goal_analysis['target_item']
+    if elements['search_boxes'] and target_item:
+        return f"fill('search', '{target_item}')"
+    elif elements['buttons']:
+        return "click('button')"
+    elif elements['links']:
+        return "click('link')"
+    elif elements['inputs']:
+        return "fill('input', 'text')"
+    return "noop()"
+
+# Action generator per goal intent; unknown intents use _handle_default
+_INTENT_HANDLERS = {
+    'search': _handle_search,
+    'purchase': _handle_purchase,
+    'compare': _handle_compare,
+    'click': _handle_click,
+    'form_fill': _handle_form_fill,
+    'navigate': _handle_navigate,
+}
+
+@dataclasses.dataclass(**_DATACLASS_SLOTS)
 class RealEnhancedAgentArgs(AbstractAgentArgs):
     """Arguments for the REAL Enhanced Agent."""
     agent_name: str = "RealEnhancedAgent"
@@ -34,6 +269,8 @@ class RealEnhancedAgentArgs(AbstractAgentArgs):
     use_axtree: bool = True
     use_screenshot: bool = True
     max_steps: int = 25
+    memory_file: Optional[str] = None  # Episodic memory file shared across runs; saved on close
+    critique_every: int = 3  # Self-critique every N steps (and after any action error)
     
     def make_agent(self) -> "RealEnhancedAgent":
         """Create an instance of the enhanced agent."""
@@ -51,20 +288,12 @@ class RealEnhancedAgent(Agent):
         self.retry_attempts = args.retry_attempts
         self.simulate_execution = args.simulate_execution
         
-        # Initialize action set with fallback
-        try:
-            self.action_set = HighLevelActionSet(
-                subsets=["chat", "bid", "infeas"],
-                strict=False,
-                multiaction=False,
-                demo_mode="off"
-            )
-        except TypeError:
-            self.action_set = HighLevelActionSet()
+        # Initialize action set (shared across agent instances)
+        self.action_set = _get_action_set(("chat", "bid", "infeas"), False, False, "off")
         
         # Initialize enhanced components
         self.state_hasher = StateHasher()
-        self.episodic_memory = EpisodicMemory()
+        self.episodic_memory = EpisodicMemory(persistence_file=args.memory_file)
         self.working_memory = WorkingMemory()
         self.self_critique = SelfCritiqueSystem()
         self.planner = HierarchicalPlanner()
@@ -85,13 +314,17 @@ class RealEnhancedAgent(Agent):
             'success_rate': 0,
             'retry_rate': 0,
             'avg_execution_time': 0,
-            'recent_errors': []
+            'recent_errors': deque(maxlen=_HISTORY_SIZE)
         }
         
-        # Action history for analysis
-        self.action_history = []
+        # Action history for analysis (bounded; only the latest entry is read)
+        self.action_history = deque(maxlen=_HISTORY_SIZE)
         self.last_observation = None
         
+        # Actions already generated per page, see _action_cache_key (FIFO-bounded)
+        self._action_cache: Dict[str, tuple] = {}
+        self._last_cache_key: Optional[str] = None
+        
         print(f"REAL Enhanced Agent initialized successfully!")
         print(f"Model: {self.model_name}")
         print(f"Enhanced features: Memory, Self-Critique, Planning, Advanced Retry")
@@ -99,42 +332,15 @@ class RealEnhancedAgent(Agent):
     def _extract_goal_safely(self, obs: dict) -> str:
         """Safely extract goal from observation, handling multiple formats."""
         goal_object = obs.get('goal_object')
-        
-        if isinstance(goal_object, dict):
-            # Standard dict format: {'utterance': 'goal text'}
-            return goal_object.get('utterance', '')
-        elif isinstance(goal_object, list) and len(goal_object) > 0:
-            # Handle OpenAI-style message format: [{'role': 'user', 'content': 'goal text'}]
-            for msg in goal_object:
-                if isinstance(msg, dict) and msg.get('role') == 'user':
-                    return msg.get('content', '')
-            # Fallback to first message content
-            first_msg = goal_object[0]
-            if isinstance(first_msg, dict):
-                return first_msg.get('content', first_msg.get('utterance', ''))
-            else:
-                return str(first_msg)
-        elif isinstance(goal_object, str):
-            # Direct string format
-            return goal_object
-        else:
-            # Fallback for any other format
-            return ''
+        extractor = _GOAL_EXTRACTORS.get(type(goal_object))
+        return extractor(goal_object) if extractor else ''
     
     def obs_preprocessor(self, obs: dict) -> dict:
         """Enhanced observation preprocessing with validation."""
-        # Debug: Print the raw observation structure
-        print(f"DEBUG: Raw observation keys: {list(obs.keys())}")
-        if 'goal' in obs:
-            print(f"DEBUG: Direct goal found: '{obs['goal']}'")
-        if 'goal_object' in obs:
-            print(f"DEBUG: Goal object found: {obs['goal_object']}")
-        
         # Validate required fields
-        required_fields = ['screenshot']
-        for field in required_fields:
+        for field in _REQUIRED_OBS_FIELDS:
             if field not in obs:
-                print(f"Warning: Missing required observation field: {field}")
+                logger.warning("Missing required observation field: %s", field)
         
         processed_obs = {
             "chat_messages": obs.get("chat_messages", []),
@@ -142,6 +348,7 @@ class RealEnhancedAgent(Agent):
             "goal_object": obs.get("goal_object", {}),
             "last_action": obs.get("last_action", ""),
             "last_action_error": obs.get("last_action_error", ""),
+            "url": obs.get("url", ""),
         }
         
         # Extract goal - REAL framework provides 'goal' directly in observations
@@ -152,15 +359,45 @@ class RealEnhancedAgent(Agent):
             goal = self._extract_goal_safely(obs)
             processed_obs['goal'] = goal
         
-        # Add structured text representations
-        if "axtree_object" in obs:
+        # Add structured text representations. The lowercased copies are made
+        # once here for the keyword analyzers; only the lowered DOM is kept.
+        # Tree flattening is skipped entirely for disabled modalities.
+        if self.args.use_axtree and "axtree_object" in obs:
             processed_obs["axtree_txt"] = flatten_axtree_to_str(obs["axtree_object"])
+            processed_obs["axtree_lower"] = processed_obs["axtree_txt"].lower()
+        
+        if self.args.use_html and "dom_object" in obs:
+            processed_obs["dom_lower"] = prune_html(flatten_dom_to_str(obs["dom_object"])).lower()
         
-        if "dom_object" in obs:
-            processed_obs["pruned_html"] = prune_html(flatten_dom_to_str(obs["dom_object"]))
+        # get_action re-runs this on an already processed observation; carry
+        # the text fields over instead of dropping them
+        for key in ("axtree_txt", "axtree_lower", "dom_lower"):
+            if key not in processed_obs and key in obs:
+                processed_obs[key] = obs[key]
         
         return processed_obs
     
+    @staticmethod
+    def _action_cache_key(processed_obs: dict) -> Optional[str]:
+        """Key for the action cache: goal, URL and a digest of the full page text.
+        
+        StateHasher.hash_state is too coarse for this (it only counts element
+        types), so distinct pages would replay each other's actions. Returns
+        None when neither the AXTree nor the DOM is available, as nothing then
+        tells pages apart and the action must not be cached.
+        """
+        axtree = processed_obs.get('axtree_txt', '')
+        dom = processed_obs.get('dom_lower', '')
+        if not axtree and not dom:
+            return None
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (processed_obs.get('goal', ''), processed_obs.get('url', ''), axtree, dom):
+            data = str(part).encode('utf-8', 'surrogatepass')
+            # Length-prefix each part so field boundaries can't be shifted
+            digest.update(len(data).to_bytes(8, 'little'))
+            digest.update(data)
+        return digest.hexdigest()
+    
     def get_action(self, obs: dict) -> tuple[str, dict]:
         """Generate the next action using enhanced decision-making."""
         start_time = time.time()
@@ -175,6 +412,52 @@ class RealEnhancedAgent(Agent):
         # Generate state hash for memory systems
         state_hash = self.state_hasher.hash_state(processed_obs)
         
+        # A failed action must not be replayed: drop the entry that produced it
+        last_action_error = processed_obs.get('last_action_error', '')
+        if last_action_error and self._last_cache_key is not None:
+            self._action_cache.pop(self._last_cache_key, None)
+        
+        # Unchanged page: reuse the action generated for it last time
+        cache_key = self._action_cache_key(processed_obs)
+        self._last_cache_key = cache_key
+        cached = None if last_action_error or cache_key is None else self._action_cache.get(cache_key)
+        if cached is not None:
+            action_text, critique = cached
+        else:
+            run_critique = bool(last_action_error) or self.stats['step_count'] % max(1, self.args.critique_every) == 0
+            action_text, critique = self._run_action_pipeline(processed_obs, state_hash, run_critique)
+            if cache_key is not None:
+                if len(self._action_cache) >= _ACTION_CACHE_SIZE:
+                    self._action_cache.pop(next(iter(self._action_cache)))
+                self._action_cache[cache_key] = (action_text, critique)
+        
+        # Skipped critiques count as full confidence
+        confidence = critique.confidence_score if critique else 1.0
+        
+        # Store action in history
+        self.action_history.append(ActionRecord(
+            action=action_text,
+            state_hash=state_hash,
+            timestamp=time.time(),
+            confidence=confidence,
+            recommendation=critique.recommendations[0] if critique and critique.recommendations else None
+        ))
+        
+        # Update performance stats
+        execution_time = time.time() - start_time
+        self.stats['total_actions'] += 1
+        # Running mean: avg += (x - avg) / n
+        self.stats['avg_execution_time'] += (
+            (execution_time - self.stats['avg_execution_time']) / self.stats['total_actions']
+        )
+        
+        return action_text, {"reasoning": f"Enhanced action with {confidence:.2f} confidence"}
+    
+    def _run_action_pipeline(self, processed_obs: dict, state_hash: str, run_critique: bool = True) -> tuple:
+        """Generate and self-critique an action for a state not served from the cache.
+        
+        The critique is None when run_critique is False.
+        """
         # Check episodic memory for similar states
         best_action_info = self.episodic_memory.get_best_action_for_state(state_hash, "real_benchmark")
         
@@ -185,6 +468,9 @@ class RealEnhancedAgent(Agent):
         # Generate action using enhanced logic
         action_text = self._generate_enhanced_action(processed_obs, best_action_info)
         
+        if not run_critique:
+            return action_text, None
+        
         # Self-critique the proposed action
         critique = self.self_critique.evaluate_action_outcome(
             action_text, processed_obs, processed_obs
@@ -194,24 +480,7 @@ class RealEnhancedAgent(Agent):
         if critique.confidence_score < 0.7 and critique.recommendations:
             action_text = self._apply_critique_recommendations(action_text, critique)
         
-        # Store action in history
-        action_record = {
-            'action': action_text,
-            'state_hash': state_hash,
-            'timestamp': time.time(),
-            'critique': critique
-        }
-        self.action_history.append(action_record)
-        
-        # Update performance stats
-        execution_time = time.time() - start_time
-        self.stats['total_actions'] += 1
-        self.stats['avg_execution_time'] = (
-            (self.stats['avg_execution_time'] * (self.stats['total_actions'] - 1) + execution_time) /
-            self.stats['total_actions']
-        )
-        
-        return action_text, {"reasoning": f"Enhanced action with {critique.confidence_score:.2f} confidence"}
+        return action_text, critique
     
     def _generate_enhanced_action(self, obs: dict, best_action_info) -> str:
         """Generate enhanced action using sophisticated web navigation logic."""
@@ -220,15 +489,15 @@ class RealEnhancedAgent(Agent):
         if not goal:
             goal = self._extract_goal_safely(obs)
         
-        print(f"DEBUG: Extracted goal: '{goal}'")
+        logger.debug("Extracted goal: '%s'", goal)
         
-        # Get page context from DOM and AXTree
-        dom_text = obs.get('pruned_html', '')
-        axtree_text = obs.get('axtree_txt', '')
+        # Get page context from DOM and AXTree (lowercased by obs_preprocessor)
+        dom_lower = obs.get('dom_lower', '')
+        axtree_lower = obs.get('axtree_lower', '')
         last_action_error = obs.get('last_action_error', '')
         
         # Analyze page content for actionable elements
-        actionable_elements = self._analyze_page_elements(dom_text, axtree_text)
+        actionable_elements = self._analyze_page_elements(dom_lower, axtree_lower)
         
         # Parse goal into actionable components
         goal_analysis = self._analyze_goal(goal)
@@ -236,11 +505,14 @@ class RealEnhancedAgent(Agent):
         # Generate action based on goal analysis and page context
         action = self._generate_contextual_action(goal_analysis, actionable_elements, last_action_error)
         
-        print(f"DEBUG: Generated action: '{action}'")
+        logger.debug("Generated action: '%s'", action)
         return action
     
-    def _analyze_page_elements(self, dom_text: str, axtree_text: str) -> dict:
-        """Analyze page elements to identify actionable components."""
+    def _analyze_page_elements(self, dom_lower: str, axtree_lower: str) -> dict:
+        """Analyze page elements to identify actionable components.
+        
+        Both texts must already be lowercased.
+        """
         elements = {
             'buttons': [],
             'inputs': [],
@@ -251,181 +523,62 @@ class RealEnhancedAgent(Agent):
             'clickable_elements': []
         }
         
-        # Analyze DOM for common patterns
-        dom_lower = dom_text.lower()
-        axtree_lower = axtree_text.lower()
+        # Detect every keyword in one pass per text source
+        dom_hits = _find_page_keywords(dom_lower)
+        axtree_hits = _find_page_keywords(axtree_lower)
+        hits = dom_hits | axtree_hits
         
         # Find buttons
-        button_keywords = ['button', 'btn', 'submit', 'buy now', 'add to cart', 'search', 'login', 'sign in']
-        for keyword in button_keywords:
-            if keyword in dom_lower or keyword in axtree_lower:
-                elements['buttons'].append(keyword)
+        elements['buttons'] = [keyword for keyword in _BUTTON_KEYWORDS if keyword in hits]
         
         # Find input fields
-        input_keywords = ['input', 'textbox', 'search', 'email', 'password', 'name', 'address']
-        for keyword in input_keywords:
-            if keyword in dom_lower or keyword in axtree_lower:
-                elements['inputs'].append(keyword)
+        elements['inputs'] = [keyword for keyword in _INPUT_KEYWORDS if keyword in hits]
         
         # Find links
-        if 'link' in axtree_lower or '<a' in dom_lower:
+        if 'link' in axtree_hits or '<a' in dom_hits:
             elements['links'].append('link')
         
         # Find search functionality
-        if 'search' in dom_lower or 'search' in axtree_lower:
+        if 'search' in hits:
             elements['search_boxes'].append('search')
         
         # Find forms
-        if 'form' in dom_lower:
+        if 'form' in dom_hits:
             elements['forms'].append('form')
         
         return elements
     
     def _analyze_goal(self, goal: str) -> dict:
         """Analyze goal to extract actionable intent and targets."""
-        goal_lower = goal.lower()
-        
-        analysis = {
-            'intent': 'unknown',
-            'target_item': '',
-            'action_type': 'navigate',
-            'specific_actions': [],
-            'payment_info': {},
-            'search_terms': []
+        analysis = _analyze_goal_cached(goal)
+        # Hand out copies of the mutable fields so the cached entry stays intact
+        return {
+            **analysis,
+            'specific_actions': list(analysis['specific_actions']),
+            'payment_info': dict(analysis['payment_info']),
+            'search_terms': list(analysis['search_terms']),
         }
-        
-        # Identify primary intent
-        if 'search' in goal_lower or 'find' in goal_lower:
-            analysis['intent'] = 'search'
-        elif 'buy' in goal_lower or 'purchase' in goal_lower:
-            analysis['intent'] = 'purchase'
-        elif 'compare' in goal_lower:
-            analysis['intent'] = 'compare'
-        elif 'login' in goal_lower or 'sign in' in goal_lower:
-            analysis['intent'] = 'login'
-        elif 'fill' in goal_lower or 'enter' in goal_lower:
-            analysis['intent'] = 'form_fill'
-        elif 'click' in goal_lower:
-            analysis['intent'] = 'click'
-        elif 'navigate' in goal_lower or 'go to' in goal_lower:
-            analysis['intent'] = 'navigate'
-        
-        # Extract target items/products
-        product_keywords = ['playstation', 'dualsense', 'samsung', 'galaxy', 'iphone', 'laptop', 'espresso', 'machine']
-        for keyword in product_keywords:
-            if keyword in goal_lower:
-                analysis['target_item'] = keyword
-                analysis['search_terms'].append(keyword)
-                break
-        
-        # Extract payment information if present
-        if 'payment' in goal_lower or 'card' in goal_lower:
-            # Look for card numbers, names, etc.
-            import re
-            card_pattern = r'\d{4}\s*\d{4}\s*\d{4}\s*\d{4}'
-            card_match = re.search(card_pattern, goal)
-            if card_match:
-                analysis['payment_info']['card_number'] = card_match.group()
-            
-            name_pattern = r'name:\s*([^,\n]+)'
-            name_match = re.search(name_pattern, goal, re.IGNORECASE)
-            if name_match:
-                analysis['payment_info']['name'] = name_match.group(1).strip()
-        
-        # Extract specific action sequences
-        if 'first result' in goal_lower:
-            analysis['specific_actions'].append('click_first_result')
-        if 'buy now' in goal_lower:
-            analysis['specific_actions'].append('click_buy_now')
-        if 'change' in goal_lower and 'payment' in goal_lower:
-            analysis['specific_actions'].append('change_payment_method')
-        
-        return analysis
     
     def _generate_contextual_action(self, goal_analysis: dict, elements: dict, last_error: str) -> str:
         """Generate contextual action based on goal analysis and page elements."""
         intent = goal_analysis['intent']
         target_item = goal_analysis['target_item']
-        specific_actions = goal_analysis['specific_actions']
         
         # Handle errors from previous actions
         if last_error:
-            if 'not found' in last_error.lower():
+            last_error_lower = last_error.lower()
+            if 'not found' in last_error_lower:
                 # Try alternative selectors or actions
                 if intent == 'search' and elements['search_boxes']:
                     return "fill('search', '" + target_item + "')"
                 elif intent == 'click' and elements['buttons']:
                     return "click('button')"
-            elif 'timeout' in last_error.lower():
+            elif 'timeout' in last_error_lower:
                 return "noop()"  # Wait for page to load
         
         # Generate action based on intent and available elements
-        if intent == 'search':
-            if target_item and elements['search_boxes']:
-                return f"fill('search', '{target_item}')"
-            elif elements['search_boxes']:
-                return "fill('search', 'product')"
-            elif elements['inputs']:
-                return f"fill('input', '{target_item}')" if target_item else "fill('input', 'search term')"
-            else:
-                return "goto('/')"  # Navigate to home page to find search
-        
-        elif intent == 'purchase':
-            if 'click_buy_now' in specific_actions and elements['buttons']:
-                # Look for buy now button specifically
-                if any('buy' in btn for btn in elements['buttons']):
-                    return "click('Buy Now')"
-                else:
-                    return "click('button')"
-            elif elements['buttons']:
-                return "click('Add to Cart')"
-            else:
-                return "noop()"  # Wait for page to load
-        
-        elif intent == 'compare':
-            if target_item:
-                return f"goto('https://omnizon.com')"  # Start at main site
-            else:
-                return "goto('/')"
-        
-        elif intent == 'click':
-            if 'click_first_result' in specific_actions:
-                return "click('first')"
-            elif elements['buttons']:
-                return "click('button')"
-            elif elements['links']:
-                return "click('link')"
-            else:
-                return "click('element')"
-        
-        elif intent == 'form_fill':
-            payment_info = goal_analysis.get('payment_info', {})
-            if payment_info and 'name' in payment_info:
-                return f"fill('name', '{payment_info['name']}')"
-            elif payment_info and 'card_number' in payment_info:
-                return f"fill('card', '{payment_info['card_number']}')"
-            elif elements['inputs']:
-                return "fill('input', 'information')"
-            else:
-                return "noop()"
-        
-        elif intent == 'navigate':
-            if target_item:
-                return f"goto('/{target_item}')"
-            else:
-                return "goto('/')"
-        
-        # Default fallback actions based on available elements
-        if elements['search_boxes'] and target_item:
-            return f"fill('search', '{target_item}')"
-        elif elements['buttons']:
-            return "click('button')"
-        elif elements['links']:
-            return "click('link')"
-        elif elements['inputs']:
-            return "fill('input', 'text')"
-        else:
-            return "noop()"
+        handler = _INTENT_HANDLERS.get(intent, _handle_default)
+        return handler(goal_analysis, elements)
     
     def _apply_critique_recommendations(self, action: str, critique) -> str:
         """Apply self-critique recommendations to improve action."""
@@ -453,11 +606,11 @@ class RealEnhancedAgent(Agent):
             
             # Store episode in memory
             self.episodic_memory.store_episode(
-                last_action['state_hash'],
-                last_action['action'],
+                last_action.state_hash,
+                last_action.action,
                 reward,
                 success,
-                execution_time=time.time() - last_action['timestamp']
+                execution_time=time.time() - last_action.timestamp
             )
     
     def close(self):
@@ -480,6 +633,10 @@ class RealEnhancedAgent(Agent):
         
         print(f"Enhanced components used: Memory, Self-Critique, Planning, Retry")
         print(f"========================================\n")
+        
+        # Persist episodic memory so later runs start warm
+        if self.args.memory_file:
+            self.episodic_memory.save_memory()
 
 # Factory function for REAL framework
 def make_agent(args: RealEnhancedAgentArgs) -> RealEnhancedAgent:
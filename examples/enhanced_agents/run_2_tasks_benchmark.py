@@ -6,8 +6,18 @@ This script runs a limited REAL benchmark evaluation (2 tasks) using our enhance
 with memory, self-critique, planning, and advanced retry capabilities.
 """
 
+import argparse
+import asyncio
+import atexit
+import dataclasses
+import logging
+import logging.handlers
 import os
+import queue
+import shutil
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add the current directory to Python path for imports
@@ -15,6 +25,38 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from agisdk import REAL
 from real_enhanced_agent import RealEnhancedAgentArgs
+from memory_systems import EpisodicMemory
+
+def configure_logging(level=logging.INFO):
+    """Route log records through a queue so writes happen on a background thread.
+    
+    Returns the started QueueListener; stop it before exiting to flush pending records.
+    """
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+    logging.basicConfig(level=level, handlers=[logging.handlers.QueueHandler(log_queue)], force=True)
+    listener.start()
+    return listener
+
+# Queue listener of a worker process, set by init_worker_logging
+_worker_log_listener = None
+
+def init_worker_logging(level=logging.INFO):
+    """ProcessPoolExecutor initializer: queued logging for the worker process."""
+    global _worker_log_listener
+    _worker_log_listener = configure_logging(level)
+    atexit.register(_worker_log_listener.stop)
+
+def flush_worker_logs():
+    """Write out the worker's queued log records.
+    
+    The listener thread is a daemon and forked workers exit without running
+    atexit hooks, so records still queued when a task returns would be lost.
+    Stopping the listener drains the queue; it is then restarted for the next task.
+    """
+    if _worker_log_listener is not None:
+        _worker_log_listener.stop()
+        _worker_log_listener.start()
 
 def run_single_task(task_name, agent_args):
     """Run a single task and return results."""
@@ -37,10 +79,79 @@ def run_single_task(task_name, agent_args):
     except Exception as e:
         print(f"Error running task {task_name}: {e}")
         return None
+    finally:
+        flush_worker_logs()
+
+def task_memory_file(memory_file, task_name):
+    """Per-task copy of the episodic memory file, so concurrent tasks never write the same file."""
+    path = Path(memory_file)
+    return str(path.with_name(f"{path.stem}.{task_name}{path.suffix}"))
+
+async def run_tasks_concurrently(tasks_to_run, agent_args, concurrency, log_level=logging.INFO):
+    """Run tasks in worker processes, at most `concurrency` at a time.
+    
+    Each worker process launches its own headless browser, so browser launches
+    overlap instead of running back to back and sessions stay isolated.
+    Results are returned in task order. Each worker sets up its own queued logging.
+    
+    With a memory file, each task starts from a copy of it and saves to its own
+    file; what the tasks learned is merged back into the shared file afterwards.
+    """
+    memory_file = agent_args.memory_file
+    task_args = {task_name: agent_args for task_name in tasks_to_run}
+    if memory_file:
+        started_at = time.time()
+        for task_name in tasks_to_run:
+            task_file = task_memory_file(memory_file, task_name)
+            if Path(memory_file).exists():
+                shutil.copyfile(memory_file, task_file)
+            elif Path(task_file).exists():
+                os.remove(task_file)
+            task_args[task_name] = dataclasses.replace(agent_args, memory_file=task_file)
+    
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(max_workers=concurrency, initializer=init_worker_logging,
+                             initargs=(log_level,)) as pool:
+        results = await asyncio.gather(*[
+            loop.run_in_executor(pool, run_single_task, task_name, task_args[task_name])
+            for task_name in tasks_to_run
+        ])
+    
+    if memory_file:
+        merge_task_memories(memory_file, [task_memory_file(memory_file, task_name) for task_name in tasks_to_run], started_at)
+    return results
+
+def merge_task_memories(memory_file, task_files, started_at):
+    """Fold each task's episodic memory into the shared file and remove the task files."""
+    # Every task started from the shared file as it was at started_at
+    base = EpisodicMemory(persistence_file=memory_file)
+    memory = EpisodicMemory(persistence_file=memory_file)
+    for task_file in task_files:
+        if Path(task_file).exists():
+            memory.merge_memory(EpisodicMemory(persistence_file=task_file), base, since=started_at)
+            os.remove(task_file)
+    memory.save_memory()
 
 def main():
     """Run REAL benchmark evaluation with enhanced agent - limited to 2 tasks."""
     
+    parser = argparse.ArgumentParser(description="Run the 2-task REAL benchmark with the enhanced agent")
+    parser.add_argument("--concurrency", type=int, default=None,
+                        help="Maximum number of tasks to run at once (default: min(number of tasks, 4))")
+    parser.add_argument("--debug", action="store_true",
+                        help="Log per-step agent decisions")
+    args = parser.parse_args()
+    
+    log_level = logging.DEBUG if args.debug else logging.INFO
+    log_listener = configure_logging(log_level)
+    try:
+        return run_benchmark(args, log_level)
+    finally:
+        # Flush queued records even when the run fails
+        log_listener.stop()
+
+def run_benchmark(args, log_level):
+    """Run the two tasks and print their results; returns the exit code."""
     # Set up API key (you may need to set this in your environment)
     if not os.getenv('OPENAI_API_KEY'):
         print("Warning: OPENAI_API_KEY not set. You may need to set it for evaluation.")
@@ -59,7 +170,9 @@ def main():
         use_html=True,
         use_axtree=True,
         use_screenshot=True,
-        max_steps=25
+        max_steps=25,
+        # Carried across runs; concurrent tasks each learn from it and are merged back after
+        memory_file=str(Path(__file__).parent / "episodic_memory.json")
     )
     
     # Define the 2 tasks to run
@@ -75,11 +188,13 @@ def main():
     print(f"Model: {agent_args.model_name}")
     print("\nStarting evaluation...")
     
+    concurrency = args.concurrency or min(len(tasks_to_run), 4)
+    print(f"Concurrency: {concurrency}")
+    
     all_results = {}
     
-    # Run each task sequentially
-    for task_name in tasks_to_run:
-        result = run_single_task(task_name, agent_args)
+    # Run tasks concurrently in separate processes; each blocks on browser and LLM I/O
+    for result in asyncio.run(run_tasks_concurrently(tasks_to_run, agent_args, concurrency, log_level)):
         if result:
             all_results.update(result)
     
@@ -17,35 +17,174 @@ Date: January 2025
 
 import os
 import sys
+import copy
+import functools
 import json
+import logging.handlers
+import queue
+import threading
 import time
 import logging
+import re
+import traceback
+from collections import deque
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Any, Iterator, List, Optional, TextIO
 from datetime import datetime
 
+import numpy as np
+
 # Add current directory to path for imports
 sys.path.append(str(Path(__file__).parent))
 
+# The agent and REAL harness pull in the browser stack; they are imported in run_benchmark
+if TYPE_CHECKING:
+    from enhanced_agent_v2 import EnhancedAgentV2
+
+# orjson is optional; without it result files are encoded with the standard json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# numba is optional; without it trend scans run as plain Python loops
 try:
-    from enhanced_agent_v2 import EnhancedAgentV2Args, EnhancedAgentV2
-    from agisdk import REAL
-except ImportError as e:
-    print(f"Error importing required modules: {e}")
-    print("Please ensure all dependencies are installed and the enhanced agent is available.")
-    sys.exit(1)
-
-# Configure logging
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Configure logging; file writes are buffered and flushed every 1024 records (or on error/exit)
+_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+_log_file_handler = logging.FileHandler('enhanced_benchmark.log')
+_log_file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    format=_LOG_FORMAT,
     handlers=[
-        logging.FileHandler('enhanced_benchmark.log'),
+        logging.handlers.MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=_log_file_handler),
         logging.StreamHandler()
     ]
 )
 logger = logging.getLogger(__name__)
 
+def _dumps(obj: Any) -> bytes:
+    """Encode obj as compact JSON bytes; unsupported types fall back to str()."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, default=str).encode()
+
+@functools.lru_cache(maxsize=512)
+def _extract_domain_from_task(task_name: str) -> str:
+    """Extract domain from task name."""
+    task_lower = task_name.lower()
+    
+    if 'omnizon' in task_lower:
+        return 'omnizon'
+    elif 'email' in task_lower or 'mail' in task_lower:
+        return 'email'
+    elif 'calendar' in task_lower:
+        return 'calendar'
+    elif 'social' in task_lower:
+        return 'social'
+    else:
+        return 'other'
+
+def _find_success_rate_jumps(success_rates, threshold):
+    """Return indices i where success_rates[i] exceeds success_rates[i-1] by more than threshold."""
+    jumps = []
+    for i in range(1, len(success_rates)):
+        if success_rates[i] > success_rates[i - 1] + threshold:
+            jumps.append(i)
+    return jumps
+
+if NUMBA_AVAILABLE:
+    _find_success_rate_jumps = njit(cache=True)(_find_success_rate_jumps)
+
+def _dumps_pretty(obj: Any) -> str:
+    """Encode obj as indented JSON text for logs."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, indent=2, default=str)
+
+# slots=True needs Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Error categories in priority order; each lookahead scans the whole message,
+# so an earlier category wins even when a later keyword appears first
+_ERROR_CATEGORY_RE = re.compile(
+    r'^(?:(?=.*?(?P<timeout>timeout))'
+    r'|(?=.*?(?P<element_not_found>element not found|no such element))'
+    r'|(?=.*?(?P<network_error>network|connection))'
+    r'|(?=.*?(?P<javascript_error>javascript|\bjs\b))'
+    r'|(?=.*?(?P<permission_error>permission|access)))',
+    re.IGNORECASE | re.DOTALL
+)
+
+@dataclass(**_DATACLASS_SLOTS)
+class _Accumulator:
+    """Running episode totals for one domain."""
+    total: int = 0
+    successful: int = 0
+    total_steps: int = 0
+    total_time: float = 0.0
+
+@dataclass(**_DATACLASS_SLOTS)
+class EpisodeRecord:
+    """One processed benchmark episode; agent stats are snapshotted at checkpoints, not per episode."""
+    episode_number: int
+    task_name: str
+    domain: str
+    success: bool
+    steps: int
+    execution_time: float
+    error_msg: Optional[str]
+    timestamp: float
+    confidence: float
+    memory_load: int
+
+# Default runner configuration; read-only, copied per runner
+_DEFAULT_CONFIG = MappingProxyType({
+    # Agent configuration
+    'agent_config': {
+        'max_steps': 50,
+        'timeout_ms': 3000,
+        'enable_learning': True,
+        'enable_planning': True,
+        'enable_critique': True,
+        'max_episodes': 10000,
+        'max_retries': 5,
+        'base_delay': 1.0,
+        'persistence_dir': './agent_data'
+    },
+    
+    # Benchmark configuration
+    'benchmark_config': {
+        'max_steps': 50,
+        'action_space': 'browsergym',
+        'observation_space': 'browsergym',
+        'headless': True,
+        'record_video': False,
+        'enable_screenshots': True
+    },
+    
+    # Monitoring configuration
+    'monitoring': {
+        'log_interval': 10,  # Log progress every N episodes
+        'save_interval': 50,  # Save results every N episodes
+        'performance_window': 100,  # Window for performance trend analysis
+        'enable_real_time_metrics': True
+    },
+    
+    # Output configuration
+    'results_dir': './benchmark_results',
+    'save_detailed_logs': True,
+    'generate_reports': True
+})
+
 class EnhancedBenchmarkRunner:
     """
     Comprehensive benchmark runner for the Enhanced Agent v2.0.
@@ -59,8 +198,31 @@ class EnhancedBenchmarkRunner:
     """
     
     def __init__(self, config: Dict[str, Any] = None):
-        self.config = config or self._get_default_config()
-        self.results = []
+        # User settings override the defaults key by key within each section
+        self.config = self._get_default_config()
+        for key, value in (config or {}).items():
+            if isinstance(value, dict) and isinstance(self.config.get(key), dict):
+                self.config[key] = {**self.config[key], **value}
+            else:
+                self.config[key] = value
+        # Only the latest performance window is kept in memory; every episode is streamed to episodes_file
+        self.results = deque(maxlen=self.config['monitoring']['performance_window'])
+        # Success rate of each trend point, kept alongside performance_trends for numeric scans
+        self._trend_success_rates: List[float] = []
+        # Running error total and (type, count) of the most common error
+        self._error_total = 0
+        self._most_common_error = ('other', 0)
+        # Running sums over the records currently in self.results
+        self._window_successes = 0
+        self._window_steps = 0
+        self._window_time = 0.0
+        self.episodes_file = None
+        self._episodes_out = None
+        # Per-domain totals, updated as episodes are processed
+        self.domain_stats: Dict[str, _Accumulator] = {}
+        # Result files are serialized and written by a background thread during a run
+        self._io_queue = None
+        self._io_thread = None
         self.session_metrics = {
             'start_time': time.time(),
             'total_episodes': 0,
@@ -78,47 +240,12 @@ class EnhancedBenchmarkRunner:
         self.results_dir.mkdir(exist_ok=True)
         
         logger.info("Enhanced Benchmark Runner initialized")
-        logger.info(f"Configuration: {json.dumps(self.config, indent=2)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Configuration: %s", _dumps_pretty(self.config))
     
     def _get_default_config(self) -> Dict[str, Any]:
         """Get default configuration for the benchmark runner."""
-        return {
-            # Agent configuration
-            'agent_config': {
-                'max_steps': 50,
-                'timeout_ms': 3000,
-                'enable_learning': True,
-                'enable_planning': True,
-                'enable_critique': True,
-                'max_episodes': 10000,
-                'max_retries': 5,
-                'base_delay': 1.0,
-                'persistence_dir': './agent_data'
-            },
-            
-            # Benchmark configuration
-            'benchmark_config': {
-                'max_steps': 50,
-                'action_space': 'browsergym',
-                'observation_space': 'browsergym',
-                'headless': True,
-                'record_video': False,
-                'enable_screenshots': True
-            },
-            
-            # Monitoring configuration
-            'monitoring': {
-                'log_interval': 10,  # Log progress every N episodes
-                'save_interval': 50,  # Save results every N episodes
-                'performance_window': 100,  # Window for performance trend analysis
-                'enable_real_time_metrics': True
-            },
-            
-            # Output configuration
-            'results_dir': './benchmark_results',
-            'save_detailed_logs': True,
-            'generate_reports': True
-        }
+        return copy.deepcopy(dict(_DEFAULT_CONFIG))
     
     def run_benchmark(self, num_episodes: int = None, task_filter: str = None) -> Dict[str, Any]:
         """
@@ -134,6 +261,14 @@ class EnhancedBenchmarkRunner:
         logger.info("Starting Enhanced Agent REAL Benchmark")
         logger.info("=" * 60)
         
+        try:
+            from enhanced_agent_v2 import EnhancedAgentV2Args
+            from agisdk import REAL
+        except ImportError as e:
+            logger.error("Error importing required modules: %s", e)
+            logger.error("Please ensure all dependencies are installed and the enhanced agent is available.")
+            raise
+        
         try:
             # Initialize enhanced agent
             agent_args = EnhancedAgentV2Args(
@@ -148,8 +283,14 @@ class EnhancedBenchmarkRunner:
                 **self.config['benchmark_config']
             )
             
-            logger.info(f"Agent initialized: {type(agent).__name__}")
-            logger.info(f"Harness configured with {len(harness.tasks) if hasattr(harness, 'tasks') else 'unknown'} tasks")
+            logger.info("Agent initialized: %s", type(agent).__name__)
+            logger.info("Harness configured with %s tasks", len(harness.tasks) if hasattr(harness, 'tasks') else 'unknown')
+            
+            # Stream episode records to a JSONL log as they complete
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            self.episodes_file = self.results_dir / f"episodes_{timestamp}.jsonl"
+            self._episodes_out = open(self.episodes_file, 'wb', buffering=1 << 16)
+            self._start_writer()
             
             # Run benchmark episodes
             episode_count = 0
@@ -157,20 +298,26 @@ class EnhancedBenchmarkRunner:
             
             for episode_result in harness.run_episodes(num_episodes=num_episodes):
                 episode_count += 1
+                # Read the clock once per episode
+                now = time.time()
                 
                 # Process episode result
-                self._process_episode_result(episode_result, agent, episode_count)
+                self._process_episode_result(episode_result, agent, episode_count, now)
+                # Snapshot agent statistics once; shared by checkpointing and trend tracking
+                agent_stats = agent.get_stats()
                 
                 # Log progress
                 if episode_count % self.config['monitoring']['log_interval'] == 0:
-                    self._log_progress(episode_count, time.time() - start_time)
+                    self._log_progress(episode_count, now - start_time)
                 
                 # Save intermediate results
                 if episode_count % self.config['monitoring']['save_interval'] == 0:
-                    self._save_intermediate_results(episode_count)
+                    self._save_intermediate_results(episode_count, agent_stats)
                 
                 # Update performance trends
-                self._update_performance_trends(agent)
+                self._update_performance_trends(agent_stats, now)
+            
+            self._episodes_out.close()
             
             # Generate final results
             final_results = self._generate_final_results(agent, time.time() - start_time)
@@ -186,11 +333,51 @@ class EnhancedBenchmarkRunner:
             return final_results
             
         except Exception as e:
-            logger.error(f"Error running benchmark: {e}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.error("Error running benchmark: %s", e)
+            logger.error("Traceback: %s", traceback.format_exc())
             raise
+        finally:
+            if self._episodes_out is not None:
+                self._episodes_out.close()
+            self._stop_writer()
+    
+    def _start_writer(self):
+        """
+        Start the background thread that writes result files.
+        """
+        self._io_queue = queue.Queue(maxsize=4)
+        self._io_thread = threading.Thread(target=self._io_loop, name='benchmark-writer', daemon=True)
+        self._io_thread.start()
+    
+    def _stop_writer(self):
+        """
+        Wait for queued writes to finish and stop the writer thread.
+        """
+        if self._io_thread is not None:
+            self._io_queue.put(None)
+            self._io_thread.join()
+            self._io_thread = None
+    
+    def _io_loop(self):
+        """
+        Write queued (paths, payload) items until a None sentinel arrives.
+        """
+        while True:
+            item = self._io_queue.get()
+            if item is None:
+                break
+            paths, payload = item
+            try:
+                data = _dumps(payload)
+                for path in paths:
+                    with open(path, 'wb') as f:
+                        f.write(data)
+                    logger.debug("Results written to %s", path)
+            except Exception as e:
+                logger.error("Error writing results to %s: %s", paths[0], e)
     
-    def _process_episode_result(self, episode_result: Dict[str, Any], agent: EnhancedAgentV2, episode_num: int):
+    def _process_episode_result(self, episode_result: Dict[str, Any], agent: 'EnhancedAgentV2', episode_num: int,
+                                now: float):
         """
         Process individual episode results and update metrics.
         """
@@ -215,60 +402,72 @@ class EnhancedBenchmarkRunner:
                 # Track error patterns
                 if error_msg:
                     error_key = self._categorize_error(error_msg)
-                    self.session_metrics['error_patterns'][error_key] = \
-                        self.session_metrics['error_patterns'].get(error_key, 0) + 1
-            
-            # Get agent statistics
-            agent_stats = agent.get_stats()
+                    error_count = self.session_metrics['error_patterns'].get(error_key, 0) + 1
+                    self.session_metrics['error_patterns'][error_key] = error_count
+                    self._error_total += 1
+                    if error_count > self._most_common_error[1]:
+                        self._most_common_error = (error_key, error_count)
+            
+            # Update per-domain totals
+            domain = _extract_domain_from_task(task_name)
+            acc = self.domain_stats.get(domain)
+            if acc is None:
+                acc = self.domain_stats[domain] = _Accumulator()
+            acc.total += 1
+            acc.total_steps += steps
+            acc.total_time += execution_time
+            if success:
+                acc.successful += 1
             
             # Create detailed episode record
-            episode_record = {
-                'episode_number': episode_num,
-                'task_name': task_name,
-                'success': success,
-                'steps': steps,
-                'execution_time': execution_time,
-                'error_msg': error_msg,
-                'timestamp': datetime.now().isoformat(),
-                'agent_stats': agent_stats,
-                'cognitive_state': {
-                    'goal': agent.cognitive_state.current_goal,
-                    'domain': agent.cognitive_state.current_domain,
-                    'confidence': agent.cognitive_state.confidence_level,
-                    'memory_load': agent.cognitive_state.working_memory_load
-                }
-            }
+            episode_record = EpisodeRecord(
+                episode_number=episode_num,
+                task_name=task_name,
+                domain=domain,
+                success=success,
+                steps=steps,
+                execution_time=execution_time,
+                error_msg=error_msg,
+                timestamp=now,
+                confidence=agent.cognitive_state.confidence_level,
+                memory_load=agent.cognitive_state.working_memory_load
+            )
             
+            # Timestamps are formatted only when the record is written
+            log_record = asdict(episode_record)
+            log_record['timestamp'] = datetime.fromtimestamp(now).isoformat()
+            self._episodes_out.write(_dumps(log_record) + b'\n')
+            # Slide the window sums: drop the record about to be evicted, add the new one
+            if len(self.results) == self.results.maxlen:
+                oldest = self.results[0]
+                self._window_successes -= bool(oldest.success)
+                self._window_steps -= oldest.steps
+                self._window_time -= oldest.execution_time
             self.results.append(episode_record)
+            self._window_successes += bool(success)
+            self._window_steps += steps
+            self._window_time += execution_time
             
-            # Log episode completion
-            status = "SUCCESS" if success else "FAILED"
-            logger.info(f"Episode {episode_num} ({task_name}): {status} in {steps} steps ({execution_time:.2f}s)")
-            
+            # Log episode completion every log_interval episodes; failures are always logged
             if not success and error_msg:
-                logger.warning(f"  Error: {error_msg}")
+                logger.warning("Episode %d (%s): FAILED in %d steps (%.2fs)",
+                               episode_num, task_name, steps, execution_time)
+                logger.warning("  Error: %s", error_msg)
+            elif (episode_num % self.config['monitoring']['log_interval'] == 0
+                  and logger.isEnabledFor(logging.INFO)):
+                status = "SUCCESS" if success else "FAILED"
+                logger.info("Episode %d (%s): %s in %d steps (%.2fs)",
+                            episode_num, task_name, status, steps, execution_time)
             
         except Exception as e:
-            logger.error(f"Error processing episode result: {e}")
+            logger.error("Error processing episode result: %s", e)
     
     def _categorize_error(self, error_msg: str) -> str:
         """
         Categorize error messages for pattern analysis.
         """
-        error_lower = error_msg.lower()
-        
-        if 'timeout' in error_lower:
-            return 'timeout'
-        elif 'element not found' in error_lower or 'no such element' in error_lower:
-            return 'element_not_found'
-        elif 'network' in error_lower or 'connection' in error_lower:
-            return 'network_error'
-        elif 'javascript' in error_lower or 'js' in error_lower:
-            return 'javascript_error'
-        elif 'permission' in error_lower or 'access' in error_lower:
-            return 'permission_error'
-        else:
-            return 'other'
+        match = _ERROR_CATEGORY_RE.match(error_msg)
+        return match.lastgroup if match else 'other'
     
     def _log_progress(self, episode_count: int, elapsed_time: float):
         """
@@ -282,13 +481,13 @@ class EnhancedBenchmarkRunner:
         
         episodes_per_minute = (episode_count / elapsed_time) * 60
         
-        logger.info(f"Progress Update - Episode {episode_count}:")
-        logger.info(f"  Success Rate: {success_rate:.1f}%")
-        logger.info(f"  Average Steps: {avg_steps:.1f}")
-        logger.info(f"  Episodes/min: {episodes_per_minute:.1f}")
-        logger.info(f"  Elapsed Time: {elapsed_time:.1f}s")
+        logger.info("Progress Update - Episode %s:", episode_count)
+        logger.info("  Success Rate: %.1f%%", success_rate)
+        logger.info("  Average Steps: %.1f", avg_steps)
+        logger.info("  Episodes/min: %.1f", episodes_per_minute)
+        logger.info("  Elapsed Time: %.1fs", elapsed_time)
     
-    def _update_performance_trends(self, agent: EnhancedAgentV2):
+    def _update_performance_trends(self, agent_stats: Dict[str, Any], now: float):
         """
         Update performance trend analysis.
         """
@@ -296,27 +495,25 @@ class EnhancedBenchmarkRunner:
             window_size = self.config['monitoring']['performance_window']
             
             if len(self.results) >= window_size:
-                # Calculate performance metrics for the last window
-                recent_results = self.results[-window_size:]
-                
-                success_rate = sum(1 for r in recent_results if r['success']) / len(recent_results)
-                avg_steps = sum(r['steps'] for r in recent_results) / len(recent_results)
-                avg_time = sum(r['execution_time'] for r in recent_results) / len(recent_results)
+                # Calculate performance metrics for the last window from the running sums
+                success_rate = self._window_successes / window_size
+                avg_steps = self._window_steps / window_size
+                avg_time = self._window_time / window_size
                 
                 # Get agent learning metrics
-                agent_stats = agent.get_stats()
                 memory_size = agent_stats.get('system_status', {}).get('episodic_memory_size', 0)
                 
                 trend_point = {
-                    'episode': len(self.results),
+                    'episode': self.session_metrics['total_episodes'],
                     'success_rate': success_rate,
                     'avg_steps': avg_steps,
                     'avg_time': avg_time,
                     'memory_size': memory_size,
-                    'timestamp': time.time()
+                    'timestamp': now
                 }
                 
                 self.session_metrics['performance_trends'].append(trend_point)
+                self._trend_success_rates.append(success_rate)
                 
                 # Detect learning improvements
                 if len(self.session_metrics['performance_trends']) >= 2:
@@ -326,55 +523,57 @@ class EnhancedBenchmarkRunner:
                         trend_point['avg_steps'] < prev_trend['avg_steps'] - 1.0):
                         
                         improvement = {
-                            'episode': len(self.results),
+                            'episode': self.session_metrics['total_episodes'],
                             'type': 'performance_improvement',
                             'details': {
                                 'success_rate_change': trend_point['success_rate'] - prev_trend['success_rate'],
                                 'steps_change': trend_point['avg_steps'] - prev_trend['avg_steps']
                             },
-                            'timestamp': time.time()
+                            'timestamp': now
                         }
                         
                         self.session_metrics['learning_improvements'].append(improvement)
-                        logger.info(f"Learning improvement detected at episode {len(self.results)}!")
+                        logger.info("Learning improvement detected at episode %s!", self.session_metrics['total_episodes'])
         
         except Exception as e:
-            logger.error(f"Error updating performance trends: {e}")
+            logger.error("Error updating performance trends: %s", e)
     
-    def _save_intermediate_results(self, episode_count: int):
+    def _save_intermediate_results(self, episode_count: int, agent_stats: Dict[str, Any]):
         """
         Save intermediate results for recovery and analysis.
+        
+        Episode records are already in the JSONL log, so only session metrics and an agent stats snapshot are saved here.
         """
         try:
+            self._episodes_out.flush()
             intermediate_file = self.results_dir / f"intermediate_results_{episode_count}.json"
             
+            # Copy the metrics so the writer thread never sees them mid-update
             intermediate_data = {
                 'episode_count': episode_count,
-                'session_metrics': self.session_metrics,
-                'recent_results': self.results[-50:],  # Last 50 episodes
+                'session_metrics': copy.deepcopy(self.session_metrics),
+                'agent_stats': agent_stats,
+                'episodes_file': str(self.episodes_file),
                 'timestamp': datetime.now().isoformat()
             }
             
-            with open(intermediate_file, 'w') as f:
-                json.dump(intermediate_data, f, indent=2, default=str)
-            
-            logger.debug(f"Intermediate results saved to {intermediate_file}")
+            self._io_queue.put(((intermediate_file,), intermediate_data))
             
         except Exception as e:
-            logger.error(f"Error saving intermediate results: {e}")
+            logger.error("Error saving intermediate results: %s", e)
     
-    def _generate_final_results(self, agent: EnhancedAgentV2, total_time: float) -> Dict[str, Any]:
+    def _generate_final_results(self, agent: 'EnhancedAgentV2', total_time: float) -> Dict[str, Any]:
         """
         Generate comprehensive final results.
         """
         try:
             # Calculate overall metrics
-            total_episodes = len(self.results)
-            successful_episodes = sum(1 for r in self.results if r['success'])
+            total_episodes = self.session_metrics['total_episodes']
+            successful_episodes = self.session_metrics['successful_episodes']
             success_rate = (successful_episodes / total_episodes) * 100 if total_episodes > 0 else 0
             
-            avg_steps = sum(r['steps'] for r in self.results) / total_episodes if total_episodes > 0 else 0
-            avg_time = sum(r['execution_time'] for r in self.results) / total_episodes if total_episodes > 0 else 0
+            avg_steps = self.session_metrics['total_steps'] / total_episodes if total_episodes > 0 else 0
+            avg_time = self.session_metrics['total_execution_time'] / total_episodes if total_episodes > 0 else 0
             
             # Get final agent statistics
             final_agent_stats = agent.get_stats()
@@ -416,69 +615,74 @@ class EnhancedBenchmarkRunner:
                 
                 'performance_trends': self.session_metrics['performance_trends'],
                 
-                'detailed_results': self.results if self.config.get('save_detailed_logs', True) else None
+                'detailed_results': str(self.episodes_file) if self.config.get('save_detailed_logs', True) else None
             }
             
             return final_results
             
         except Exception as e:
-            logger.error(f"Error generating final results: {e}")
+            logger.error("Error generating final results: %s", e)
             return {'error': str(e)}
     
-    def _analyze_domain_performance(self) -> Dict[str, Any]:
+    def _analyze_domain_performance(self, accumulators: Dict[str, _Accumulator] = None) -> Dict[str, Any]:
         """
-        Analyze performance by task domain.
+        Analyze performance by task domain (from this run's running totals by default).
         """
         domain_stats = {}
         
-        for result in self.results:
-            task_name = result.get('task_name', 'unknown')
-            domain = self._extract_domain_from_task(task_name)
-            
-            if domain not in domain_stats:
-                domain_stats[domain] = {
-                    'total': 0,
-                    'successful': 0,
-                    'total_steps': 0,
-                    'total_time': 0.0
-                }
-            
-            domain_stats[domain]['total'] += 1
-            domain_stats[domain]['total_steps'] += result.get('steps', 0)
-            domain_stats[domain]['total_time'] += result.get('execution_time', 0.0)
-            
-            if result.get('success', False):
-                domain_stats[domain]['successful'] += 1
-        
-        # Calculate derived metrics
-        for domain, stats in domain_stats.items():
-            if stats['total'] > 0:
-                stats['success_rate'] = (stats['successful'] / stats['total']) * 100
-                stats['avg_steps'] = stats['total_steps'] / stats['total']
-                stats['avg_time'] = stats['total_time'] / stats['total']
-            else:
-                stats['success_rate'] = 0
-                stats['avg_steps'] = 0
-                stats['avg_time'] = 0
+        for domain, acc in (accumulators if accumulators is not None else self.domain_stats).items():
+            domain_stats[domain] = {
+                'total': acc.total,
+                'successful': acc.successful,
+                'total_steps': acc.total_steps,
+                'total_time': acc.total_time,
+                'success_rate': (acc.successful / acc.total) * 100,
+                'avg_steps': acc.total_steps / acc.total,
+                'avg_time': acc.total_time / acc.total
+            }
         
         return domain_stats
     
-    def _extract_domain_from_task(self, task_name: str) -> str:
-        """
-        Extract domain from task name.
-        """
-        task_lower = task_name.lower()
-        
-        if 'omnizon' in task_lower:
-            return 'omnizon'
-        elif 'email' in task_lower or 'mail' in task_lower:
-            return 'email'
-        elif 'calendar' in task_lower:
-            return 'calendar'
-        elif 'social' in task_lower:
-            return 'social'
-        else:
-            return 'other'
+    def _iter_records(self, episodes_file: Path = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream episode records back from a JSONL log, one line at a time.
+        """
+        episodes_file = episodes_file or self.episodes_file
+        if episodes_file is None:
+            return
+        loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+        with open(episodes_file, 'rb') as f:
+            for line in f:
+                yield loads(line)
+    
+    def analyze_episode_log(self, episodes_file: Path = None) -> Dict[str, Any]:
+        """
+        Recompute domain performance and error patterns from an episode log in one streaming pass.
+        
+        Memory use depends on the number of domains and error types, not episodes, so logs
+        from earlier or larger runs can be analyzed after the fact.
+        """
+        domains: Dict[str, _Accumulator] = {}
+        error_patterns: Dict[str, int] = {}
+        
+        for record in self._iter_records(episodes_file):
+            domain = record.get('domain') or _extract_domain_from_task(record.get('task_name', 'unknown'))
+            acc = domains.get(domain)
+            if acc is None:
+                acc = domains[domain] = _Accumulator()
+            acc.total += 1
+            acc.total_steps += record.get('steps', 0)
+            acc.total_time += record.get('execution_time', 0.0)
+            if record.get('success', False):
+                acc.successful += 1
+            elif record.get('error_msg'):
+                error_key = self._categorize_error(record['error_msg'])
+                error_patterns[error_key] = error_patterns.get(error_key, 0) + 1
+        
+        return {
+            'domain_performance': self._analyze_domain_performance(domains),
+            'error_patterns': error_patterns
+        }
     
     def _analyze_learning_progression(self) -> Dict[str, Any]:
         """
@@ -498,18 +702,15 @@ class EnhancedBenchmarkRunner:
         final_avg_steps = trends[-1]['avg_steps']
         steps_improvement = initial_avg_steps - final_avg_steps
         
-        # Detect learning phases
+        # Detect learning phases; dicts are built only for the detected jumps
+        success_rates = np.asarray(self._trend_success_rates, dtype=np.float64)
         learning_phases = []
-        for i in range(1, len(trends)):
-            prev_trend = trends[i-1]
-            curr_trend = trends[i]
-            
-            if curr_trend['success_rate'] > prev_trend['success_rate'] + 0.1:
-                learning_phases.append({
-                    'episode': curr_trend['episode'],
-                    'type': 'success_rate_jump',
-                    'improvement': curr_trend['success_rate'] - prev_trend['success_rate']
-                })
+        for i in _find_success_rate_jumps(success_rates, 0.1):
+            learning_phases.append({
+                'episode': trends[i]['episode'],
+                'type': 'success_rate_jump',
+                'improvement': trends[i]['success_rate'] - trends[i-1]['success_rate']
+            })
         
         return {
             'status': 'analyzed',
@@ -524,7 +725,7 @@ class EnhancedBenchmarkRunner:
         """
         Analyze error patterns and frequencies.
         """
-        total_errors = sum(self.session_metrics['error_patterns'].values())
+        total_errors = self._error_total
         
         if total_errors == 0:
             return {'status': 'no_errors'}
@@ -534,8 +735,8 @@ class EnhancedBenchmarkRunner:
         for error_type, count in self.session_metrics['error_patterns'].items():
             error_percentages[error_type] = (count / total_errors) * 100
         
-        # Find most common error
-        most_common_error = max(self.session_metrics['error_patterns'].items(), key=lambda x: x[1])
+        # Most common error is tracked as errors are recorded
+        most_common_error = self._most_common_error
         
         return {
             'status': 'analyzed',
@@ -557,18 +758,14 @@ class EnhancedBenchmarkRunner:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             results_file = self.results_dir / f"enhanced_benchmark_results_{timestamp}.json"
             
-            with open(results_file, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
-            
-            logger.info(f"Final results saved to {results_file}")
-            
             # Also save a latest results file
             latest_file = self.results_dir / "latest_results.json"
-            with open(latest_file, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
+            
+            self._io_queue.put(((results_file, latest_file), results))
+            logger.info("Final results queued for %s", results_file)
             
         except Exception as e:
-            logger.error(f"Error saving final results: {e}")
+            logger.error("Error saving final results: %s", e)
     
     def _generate_reports(self, results: Dict[str, Any]):
         """
@@ -579,18 +776,18 @@ class EnhancedBenchmarkRunner:
             report_file = self.results_dir / f"benchmark_report_{timestamp}.md"
             
             with open(report_file, 'w') as f:
-                f.write(self._generate_markdown_report(results))
+                self._write_markdown_report(results, f)
             
-            logger.info(f"Benchmark report generated: {report_file}")
+            logger.info("Benchmark report generated: %s", report_file)
             
         except Exception as e:
-            logger.error(f"Error generating reports: {e}")
+            logger.error("Error generating reports: %s", e)
     
-    def _generate_markdown_report(self, results: Dict[str, Any]) -> str:
+    def _write_markdown_report(self, results: Dict[str, Any], f: TextIO):
         """
-        Generate a comprehensive markdown report.
+        Write a comprehensive markdown report to an open text file.
         """
-        report = f"""
+        f.write(f"""
 # Enhanced Agent v2.0 Benchmark Report
 
 **Generated:** {results['benchmark_info']['timestamp']}  
@@ -609,20 +806,20 @@ class EnhancedBenchmarkRunner:
 
 ## Domain Performance
 
-"""
+""")
         
         # Add domain performance table
         if 'domain_performance' in results:
-            report += "| Domain | Episodes | Success Rate | Avg Steps | Avg Time |\n"
-            report += "|--------|----------|--------------|-----------|----------|\n"
+            f.write("| Domain | Episodes | Success Rate | Avg Steps | Avg Time |\n")
+            f.write("|--------|----------|--------------|-----------|----------|\n")
             
             for domain, stats in results['domain_performance'].items():
-                report += f"| {domain} | {stats['total']} | {stats['success_rate']:.1f}% | {stats['avg_steps']:.1f} | {stats['avg_time']:.2f}s |\n"
+                f.write(f"| {domain} | {stats['total']} | {stats['success_rate']:.1f}% | {stats['avg_steps']:.1f} | {stats['avg_time']:.2f}s |\n")
         
         # Add learning analysis
         if 'learning_analysis' in results and results['learning_analysis']['status'] == 'analyzed':
             learning = results['learning_analysis']
-            report += f"""
+            f.write(f"""
 
 ## Learning Analysis
 
@@ -632,12 +829,12 @@ class EnhancedBenchmarkRunner:
 - **Total Improvements:** {learning['total_improvements']}
 - **Memory Growth:** {learning['memory_growth']} episodes
 
-"""
+""")
         
         # Add error analysis
         if 'error_analysis' in results and results['error_analysis']['status'] == 'analyzed':
             errors = results['error_analysis']
-            report += f"""
+            f.write(f"""
 
 ## Error Analysis
 
@@ -646,14 +843,14 @@ class EnhancedBenchmarkRunner:
 
 ### Error Breakdown
 
-"""
+""")
             for error_type, percentage in errors['error_percentages'].items():
-                report += f"- **{error_type}:** {percentage:.1f}%\n"
+                f.write(f"- **{error_type}:** {percentage:.1f}%\n")
         
         # Add agent statistics
         if 'agent_statistics' in results:
             agent_stats = results['agent_statistics']
-            report += f"""
+            f.write(f"""
 
 ## Agent Statistics
 
@@ -668,24 +865,22 @@ class EnhancedBenchmarkRunner:
 - **Critique Enabled:** {agent_stats.get('system_status', {}).get('critique_enabled', 'N/A')}
 - **Episodic Memory Size:** {agent_stats.get('system_status', {}).get('episodic_memory_size', 'N/A')}
 
-"""
+""")
         
-        report += """
+        f.write("""
 
 ## Configuration
 
 ```json
-"""
-        report += json.dumps(results['benchmark_info']['config'], indent=2)
-        report += """
+""")
+        json.dump(results['benchmark_info']['config'], f, indent=2)
+        f.write("""
 ```
 
 ---
 
 *Report generated by Enhanced Agent v2.0 Benchmark Runner*
-"""
-        
-        return report
+""")
 
 def main():
     """
@@ -700,36 +895,14 @@ def main():
         print("Please set your OpenAI API key: export OPENAI_API_KEY='your-key-here'")
     
     try:
-        # Create benchmark runner with enhanced configuration
+        # Create benchmark runner; the demo logs and checkpoints more often than the defaults
         config = {
-            'agent_config': {
-                'max_steps': 50,
-                'timeout_ms': 3000,
-                'enable_learning': True,
-                'enable_planning': True,
-                'enable_critique': True,
-                'max_episodes': 10000,
-                'max_retries': 5,
-                'base_delay': 1.0,
-                'persistence_dir': './agent_data'
-            },
-            'benchmark_config': {
-                'max_steps': 50,
-                'action_space': 'browsergym',
-                'observation_space': 'browsergym',
-                'headless': True,
-                'record_video': False,
-                'enable_screenshots': True
-            },
             'monitoring': {
                 'log_interval': 5,
                 'save_interval': 25,
                 'performance_window': 50,
                 'enable_real_time_metrics': True
-            },
-            'results_dir': './benchmark_results',
-            'save_detailed_logs': True,
-            'generate_reports': True
+            }
         }
         
         runner = EnhancedBenchmarkRunner(config)
@@ -759,7 +932,7 @@ def main():
     except KeyboardInterrupt:
         print("\nBenchmark interrupted by user.")
     except Exception as e:
-        logger.error(f"Error in main execution: {e}")
+        logger.error("Error in main execution: %s", e)
         raise
 
 if __name__ == "__main__":
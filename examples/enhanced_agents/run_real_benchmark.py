@@ -6,8 +6,11 @@ This script runs the REAL benchmark evaluation using our enhanced agent
 with memory, self-critique, planning, and advanced retry capabilities.
 """
 
+import argparse
+import logging
 import os
 import sys
+import traceback
 from pathlib import Path
 
 # Add the current directory to Python path for imports
@@ -19,6 +22,14 @@ from real_enhanced_agent import RealEnhancedAgentArgs
 def main():
     """Run REAL benchmark evaluation with enhanced agent."""
     
+    parser = argparse.ArgumentParser(description="Run the REAL benchmark with the enhanced agent")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="Number of harness workers running tasks at once; above 1 the harness "
+                             "runs tasks through Ray and returns once all have finished (default: 1)")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO)
+    
     # Set up API key (you may need to set this in your environment)
     if not os.getenv('OPENAI_API_KEY'):
         print("Warning: OPENAI_API_KEY not set. You may need to set it for evaluation.")
@@ -46,13 +57,14 @@ def main():
             agentargs=agent_args,
             task_type="omnizon",  # Start with Amazon-like store tasks
             headless=True,  # Run headless for automated evaluation
-            max_steps=25
+            max_steps=25,
+            num_workers=args.concurrency  # Opt-in parallelism, see --concurrency
         )
         
         print(f"Running benchmark with enhanced agent: {agent_args.agent_name}")
         print(f"Task type: omnizon (Amazon-like store)")
-        print(f"Number of episodes: 3")
         print(f"Model: {agent_args.model_name}")
+        print(f"Concurrency: {args.concurrency}")
         print("\nStarting evaluation...")
         
         # Run the benchmark
@@ -86,7 +98,6 @@ def main():
     except Exception as e:
         print(f"\nError during benchmark evaluation: {e}")
         print(f"Error type: {type(e).__name__}")
-        import traceback
         traceback.print_exc()
         return 1
     
@@ -11,14 +11,77 @@ Implements Phase 3 improvements:
 """
 
 import re
+import sys
 import time
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+import functools
+import heapq
+import operator
+from typing import Dict, FrozenSet, List, Optional, Tuple, Any
 from dataclasses import dataclass
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, deque
+
+# pyahocorasick is optional; without it keyword scans use case-insensitive regexes
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Number of recent attempts per action used for its rolling success rate
+_HISTORY_WINDOW = 10
+
+# Page-text keywords that signal submitted form data / an error on the page
+_FORM_SUCCESS_KEYWORDS = ('success', 'submitted', 'saved', 'confirmed', 'thank you')
+_PAGE_ERROR_KEYWORDS = ('error', 'failed', 'invalid', 'incorrect', 'not found')
+
+
+class _KeywordScanner:
+    """Case-insensitive check for any of a fixed set of lowercase keywords in a text.
+    
+    Uses an Aho-Corasick automaton (one linear pass, independent of the keyword count)
+    when pyahocorasick is installed, otherwise a precompiled regex alternation.
+    """
+    
+    def __init__(self, keywords):
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in keywords:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+        else:
+            self._pattern = re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+    
+    def found_in(self, text: str) -> bool:
+        if not text:
+            return False
+        if AHOCORASICK_AVAILABLE:
+            return next(self._automaton.iter(text.lower()), None) is not None
+        return self._pattern.search(text) is not None
+
+
+_FORM_SUCCESS_SCANNER = _KeywordScanner(_FORM_SUCCESS_KEYWORDS)
+_PAGE_ERROR_SCANNER = _KeywordScanner(_PAGE_ERROR_KEYWORDS)
+
+# Explicit element selectors in an action string
+_SELECTOR_RE = re.compile(r'(?:id=|class=|xpath=|css=)')
+
+# Action kinds the critique helpers distinguish; an action may match several
+_ACTION_KINDS = ('click', 'type', 'scroll')
+
+# Distinct actions whose rolling success rate is kept (least recently evaluated evicted first)
+_SUCCESS_RATE_CAPACITY = 4096
+
+# Distinct error messages / (action kinds, error message) pairs remembered per system
+_CRITIQUE_CACHE_SIZE = 1024
+
+
+def _action_kinds(action: str) -> FrozenSet[str]:
+    """Return the action kinds whose name occurs in the action string."""
+    return frozenset(kind for kind in _ACTION_KINDS if kind in action)
+
 @dataclass
 class ActionCritique:
     """Comprehensive critique of an action's performance."""
@@ -36,9 +99,18 @@ class SelfCritiqueSystem:
     
     def __init__(self):
         self.confidence_threshold = 0.7
-        self.effectiveness_history = defaultdict(list)
+        # Recent effectiveness per action (bounded), with the count of successes (> 0.5) in it
+        self.effectiveness_history = defaultdict(lambda: deque(maxlen=_HISTORY_WINDOW))
+        self._recent_successes = defaultdict(int)
+        # Lifetime [attempts, effectiveness sum] per action for the performance summary;
+        # evicted together with action_success_rates
+        self._effectiveness_totals = defaultdict(lambda: [0, 0.0])
+        # Running aggregates: attempts overall and the sum of per-action means over _effectiveness_totals
+        self._total_actions = 0
+        self._mean_effectiveness_sum = 0.0
         self.error_patterns = defaultdict(int)
-        self.action_success_rates = defaultdict(float)
+        # Most recently evaluated action last, bounded to _SUCCESS_RATE_CAPACITY
+        self.action_success_rates = OrderedDict()
         
         self.success_indicators = {
             'page_change': ['url changed', 'new page loaded', 'navigation successful'],
@@ -91,20 +163,71 @@ class SelfCritiqueSystem:
                 ]
             }
         }
+        
+        # Error-pattern matcher: one named group per pattern, tried in db order, so
+        # the first pattern with any keyword in the message wins (match.lastgroup)
+        self._error_pattern_re = re.compile(
+            '^(?:' + '|'.join(
+                f"(?=.*?(?P<{name}>{'|'.join(map(re.escape, info['keywords']))}))"
+                for name, info in self.error_patterns_db.items()
+            ) + ')',
+            re.IGNORECASE | re.DOTALL
+        )
+        self._success_indicator_scanner = _KeywordScanner(
+            [indicator for indicators in self.success_indicators.values() for indicator in indicators]
+        )
+        
+        # Alternatives per action kind, checked in _ACTION_KINDS order (first match wins)
+        self._action_kind_alternatives = {
+            'click': (
+                'double_click_instead',
+                'right_click_for_context_menu',
+                'hover_before_clicking',
+                'use_keyboard_enter'
+            ),
+            'type': (
+                'clear_field_before_typing',
+                'type_character_by_character',
+                'use_keyboard_shortcuts',
+                'paste_instead_of_typing'
+            ),
+            'scroll': (
+                'use_page_down_key',
+                'scroll_to_specific_element',
+                'use_mouse_wheel',
+                'navigate_with_keyboard'
+            )
+        }
+        
+        # The same errors recur across steps and episodes; memoize the parts of a
+        # critique that depend only on the error message and action kinds
+        self._error_pattern_for = functools.lru_cache(maxsize=_CRITIQUE_CACHE_SIZE)(self._match_error_pattern)
+        self._alternatives_for = functools.lru_cache(maxsize=_CRITIQUE_CACHE_SIZE)(self._build_alternatives)
     
     def evaluate_action_outcome(self, action: str, before_state: Dict, 
                               after_state: Dict, error_msg: Optional[str] = None,
                               execution_time: float = 0.0) -> ActionCritique:
         """Comprehensive evaluation of action outcome."""
+        # Actions recur across steps and key several history dicts; intern them so
+        # lookups hit the identity fast path instead of comparing string contents
+        action = sys.intern(action)
+        
+        # Normalize states once; helpers below assume dicts
+        before_state = self._normalize_state(before_state)
+        after_state = self._normalize_state(after_state)
+        
+        # Lowercase the error message and classify the action once for all helpers
+        error_lower = error_msg.lower() if error_msg else ''
+        action_kinds = _action_kinds(action)
         
         # Calculate effectiveness score
-        effectiveness = self._assess_effectiveness(before_state, after_state, action)
+        effectiveness = self._assess_effectiveness(before_state, after_state, action_kinds)
         
         # Calculate confidence score
-        confidence = self._calculate_confidence(action, before_state, error_msg, execution_time)
+        confidence = self._calculate_confidence(action, before_state, error_lower, execution_time, action_kinds)
         
         # Generate alternative actions
-        alternatives = self._suggest_alternatives(action, before_state, error_msg)
+        alternatives = self._suggest_alternatives(action_kinds, error_msg)
         
         # Analyze error patterns
         error_analysis = self._analyze_error_patterns(error_msg) if error_msg else None
@@ -112,11 +235,16 @@ class SelfCritiqueSystem:
         # Generate reasoning
         reasoning = self._generate_reasoning(action, effectiveness, confidence, error_msg)
         
-        # Generate recommendations
-        recommendations = self._generate_recommendations(action, effectiveness, confidence, error_analysis)
-        
-        # Generate improvement suggestions
-        improvements = self._suggest_improvements(action, effectiveness, confidence, error_analysis)
+        if error_analysis is None and effectiveness >= 0.6 and confidence >= 0.6:
+            # Clear success: none of the recommendation or improvement rules apply
+            recommendations = []
+            improvements = []
+        else:
+            # Generate recommendations
+            recommendations = self._generate_recommendations(action_kinds, effectiveness, confidence, error_analysis)
+            
+            # Generate improvement suggestions
+            improvements = self._suggest_improvements(action, effectiveness, confidence, error_analysis)
         
         # Update historical data
         self._update_history(action, effectiveness, error_msg)
@@ -132,24 +260,25 @@ class SelfCritiqueSystem:
             improvement_suggestions=improvements
         )
     
-    def _assess_effectiveness(self, before_state: Dict, after_state: Dict, action: str) -> float:
+    def _assess_effectiveness(self, before_state: Dict, after_state: Dict, action_kinds: FrozenSet[str]) -> float:
         """Assess how effective the action was."""
         effectiveness_score = 0.0
         
-        # Check for positive changes
-        if self._page_changed(before_state, after_state):
-            effectiveness_score += 0.3
-            logger.debug("Page change detected - effectiveness +0.3")
-        
-        if self._new_elements_appeared(before_state, after_state):
-            effectiveness_score += 0.2
-            logger.debug("New elements appeared - effectiveness +0.2")
+        # Check for positive changes (a state compared with itself has none)
+        if before_state is not after_state:
+            if self._page_changed(before_state, after_state):
+                effectiveness_score += 0.3
+                logger.debug("Page change detected - effectiveness +0.3")
+            
+            if self._new_elements_appeared(before_state, after_state):
+                effectiveness_score += 0.2
+                logger.debug("New elements appeared - effectiveness +0.2")
         
         if self._form_data_accepted(before_state, after_state):
             effectiveness_score += 0.3
             logger.debug("Form data accepted - effectiveness +0.3")
         
-        if self._goal_progress_made(before_state, after_state, action):
+        if self._goal_progress_made(before_state, after_state, action_kinds):
             effectiveness_score += 0.2
             logger.debug("Goal progress detected - effectiveness +0.2")
         
@@ -160,17 +289,16 @@ class SelfCritiqueSystem:
         
         return max(0.0, min(1.0, effectiveness_score))
     
-    def _calculate_confidence(self, action: str, state: Dict, error_msg: Optional[str], 
-                            execution_time: float) -> float:
-        """Calculate confidence score for the action."""
+    def _calculate_confidence(self, action: str, state: Dict, error_lower: str, 
+                            execution_time: float, action_kinds: FrozenSet[str]) -> float:
+        """Calculate confidence score for the action (error_lower: lowercased error message or '')."""
         base_confidence = 0.5
         
         # Reduce confidence if there was an error
-        if error_msg:
+        if error_lower:
             base_confidence -= 0.3
             
             # Specific error penalties
-            error_lower = error_msg.lower()
             if 'not found' in error_lower:
                 base_confidence -= 0.2
             elif 'timeout' in error_lower:
@@ -181,10 +309,10 @@ class SelfCritiqueSystem:
                 base_confidence -= 0.15
         
         # Increase confidence based on action type and context
-        if 'click' in action and self._element_clearly_identified(action, state):
+        if 'click' in action_kinds and self._element_clearly_identified(action, state):
             base_confidence += 0.2
         
-        if 'type' in action and self._input_field_available(action, state):
+        if 'type' in action_kinds and self._input_field_available(action, state):
             base_confidence += 0.2
         
         # Execution time factor
@@ -200,55 +328,49 @@ class SelfCritiqueSystem:
         
         return max(0.0, min(1.0, base_confidence))
     
-    def _suggest_alternatives(self, action: str, state: Dict, error_msg: Optional[str]) -> List[str]:
+    def _match_error_pattern(self, error_msg: str) -> Optional[str]:
+        """Return the name of the first error pattern matching the message, if any."""
+        match = self._error_pattern_re.match(error_msg)
+        return match.lastgroup if match else None
+    
+    def _suggest_alternatives(self, action_kinds: FrozenSet[str], error_msg: Optional[str]) -> List[str]:
         """Suggest alternative actions based on current context."""
+        return list(self._alternatives_for(action_kinds, error_msg))
+    
+    def _build_alternatives(self, action_kinds: FrozenSet[str], error_msg: Optional[str]) -> Tuple[str, ...]:
+        """Build the alternatives for _suggest_alternatives (cached, hence a tuple)."""
         alternatives = []
         
         # Error-based alternatives
         if error_msg:
-            for pattern_name, pattern_info in self.error_patterns_db.items():
-                if any(keyword in error_msg.lower() for keyword in pattern_info['keywords']):
-                    alternatives.extend(pattern_info['alternatives'])
-                    break
+            pattern_name = self._error_pattern_for(error_msg)
+            if pattern_name:
+                alternatives.extend(self.error_patterns_db[pattern_name]['alternatives'])
         
         # Action-type based alternatives
-        if 'click' in action:
-            alternatives.extend([
-                'double_click_instead',
-                'right_click_for_context_menu',
-                'hover_before_clicking',
-                'use_keyboard_enter'
-            ])
-        elif 'type' in action:
-            alternatives.extend([
-                'clear_field_before_typing',
-                'type_character_by_character',
-                'use_keyboard_shortcuts',
-                'paste_instead_of_typing'
-            ])
-        elif 'scroll' in action:
-            alternatives.extend([
-                'use_page_down_key',
-                'scroll_to_specific_element',
-                'use_mouse_wheel',
-                'navigate_with_keyboard'
-            ])
-        
-        # Remove duplicates and return top alternatives
-        return list(dict.fromkeys(alternatives))[:5]
+        kind = next((kind for kind in _ACTION_KINDS if kind in action_kinds), None)
+        if kind:
+            alternatives.extend(self._action_kind_alternatives[kind])
+        
+        # Remove duplicates and return top alternatives, stopping at the fifth
+        top_alternatives = []
+        for alternative in alternatives:
+            if alternative not in top_alternatives:
+                top_alternatives.append(alternative)
+                if len(top_alternatives) == 5:
+                    break
+        return tuple(top_alternatives)
     
     def _analyze_error_patterns(self, error_msg: str) -> Optional[str]:
         """Analyze error message for patterns and categorization."""
         if not error_msg:
             return None
         
-        error_lower = error_msg.lower()
-        
-        for pattern_name, pattern_info in self.error_patterns_db.items():
-            if any(keyword in error_lower for keyword in pattern_info['keywords']):
-                self.error_patterns[pattern_name] += 1
-                return f"Error pattern '{pattern_name}' detected (severity: {pattern_info['severity']}). " \
-                       f"This pattern has occurred {self.error_patterns[pattern_name]} times."
+        pattern_name = self._error_pattern_for(error_msg)
+        if pattern_name:
+            self.error_patterns[pattern_name] += 1
+            return f"Error pattern '{pattern_name}' detected (severity: {self.error_patterns_db[pattern_name]['severity']}). " \
+                   f"This pattern has occurred {self.error_patterns[pattern_name]} times."
         
         # Generic error analysis
         self.error_patterns['unknown_error'] += 1
@@ -289,7 +411,7 @@ class SelfCritiqueSystem:
         
         return ". ".join(reasoning_parts) + "."
     
-    def _generate_recommendations(self, action: str, effectiveness: float, 
+    def _generate_recommendations(self, action_kinds: FrozenSet[str], effectiveness: float, 
                                 confidence: float, error_analysis: Optional[str]) -> List[str]:
         """Generate actionable recommendations."""
         recommendations = []
@@ -303,17 +425,18 @@ class SelfCritiqueSystem:
         if effectiveness < 0.5 and confidence < 0.5:
             recommendations.append("Consider breaking down task into smaller steps")
         
-        if error_analysis and 'timeout' in error_analysis.lower():
+        analysis_lower = error_analysis.lower() if error_analysis else ''
+        if 'timeout' in analysis_lower:
             recommendations.append("Increase wait times for page loading")
         
-        if error_analysis and 'not found' in error_analysis.lower():
+        if 'not found' in analysis_lower:
             recommendations.append("Verify element selectors and page structure")
         
         # Action-specific recommendations
-        if 'click' in action and effectiveness < 0.5:
+        if 'click' in action_kinds and effectiveness < 0.5:
             recommendations.append("Ensure element is visible and clickable before clicking")
         
-        if 'type' in action and effectiveness < 0.5:
+        if 'type' in action_kinds and effectiveness < 0.5:
             recommendations.append("Clear input field and verify it accepts text input")
         
         return recommendations
@@ -343,91 +466,85 @@ class SelfCritiqueSystem:
     
     def _update_history(self, action: str, effectiveness: float, error_msg: Optional[str]):
         """Update historical performance data."""
-        self.effectiveness_history[action].append(effectiveness)
-        
-        # Calculate rolling success rate
-        recent_effectiveness = self.effectiveness_history[action][-10:]  # Last 10 attempts
-        success_count = sum(1 for eff in recent_effectiveness if eff > 0.5)
-        self.action_success_rates[action] = success_count / len(recent_effectiveness)
+        recent_effectiveness = self.effectiveness_history[action]
+        
+        # Drop the attempt about to fall out of the window from the success count
+        if len(recent_effectiveness) == recent_effectiveness.maxlen and recent_effectiveness[0] > 0.5:
+            self._recent_successes[action] -= 1
+        recent_effectiveness.append(effectiveness)
+        if effectiveness > 0.5:
+            self._recent_successes[action] += 1
+        
+        totals = self._effectiveness_totals[action]
+        if totals[0]:
+            self._mean_effectiveness_sum -= totals[1] / totals[0]
+        totals[0] += 1
+        totals[1] += effectiveness
+        self._mean_effectiveness_sum += totals[1] / totals[0]
+        self._total_actions += 1
+        
+        # Rolling success rate over the last _HISTORY_WINDOW attempts
+        self.action_success_rates[action] = self._recent_successes[action] / len(recent_effectiveness)
+        self.action_success_rates.move_to_end(action)
+        if len(self.action_success_rates) > _SUCCESS_RATE_CAPACITY:
+            # Evict the least recently evaluated action along with its rolling window and totals
+            stale_action, _ = self.action_success_rates.popitem(last=False)
+            self.effectiveness_history.pop(stale_action, None)
+            self._recent_successes.pop(stale_action, None)
+            stale_totals = self._effectiveness_totals.pop(stale_action, None)
+            if stale_totals:
+                self._mean_effectiveness_sum -= stale_totals[1] / stale_totals[0]
         
         logger.debug(f"Updated {action} success rate: {self.action_success_rates[action]:.2f}")
     
-    # Helper methods for state analysis
+    # Helper methods for state analysis (states are normalized by evaluate_action_outcome)
+    @staticmethod
+    def _normalize_state(state: Any) -> Dict:
+        """Return state as a dict; strings and other non-dict states become url/elements/text dicts."""
+        if isinstance(state, dict):
+            return state
+        return {
+            'url': str(state) if state else '',
+            'elements': [],
+            'text': state if isinstance(state, str) else ''
+        }
+    
     def _page_changed(self, before: Dict, after: Dict) -> bool:
         """Check if page changed significantly."""
-        # Handle cases where before/after might be strings instead of dicts
-        if not isinstance(before, dict):
-            before = {'url': str(before) if before else '', 'elements': []}
-        if not isinstance(after, dict):
-            after = {'url': str(after) if after else '', 'elements': []}
-            
         before_url = before.get('url', '')
         after_url = after.get('url', '')
         return before_url != after_url
     
     def _new_elements_appeared(self, before: Dict, after: Dict) -> bool:
         """Check if new elements appeared on the page."""
-        # Handle cases where before/after might be strings instead of dicts
-        if not isinstance(before, dict):
-            before = {'url': str(before) if before else '', 'elements': []}
-        if not isinstance(after, dict):
-            after = {'url': str(after) if after else '', 'elements': []}
-            
         before_elements = len(before.get('elements', []))
         after_elements = len(after.get('elements', []))
         return after_elements > before_elements
     
     def _form_data_accepted(self, before: Dict, after: Dict) -> bool:
         """Check if form data was accepted."""
-        # Handle cases where before/after might be strings instead of dicts
-        if not isinstance(before, dict):
-            before = {'url': str(before) if before else '', 'elements': []}
-        if not isinstance(after, dict):
-            after = {'url': str(after) if after else '', 'elements': []}
-            
         # Look for success indicators in page content
-        after_text = after.get('text', '').lower()
-        success_keywords = ['success', 'submitted', 'saved', 'confirmed', 'thank you']
-        return any(keyword in after_text for keyword in success_keywords)
+        return _FORM_SUCCESS_SCANNER.found_in(after.get('text', ''))
     
-    def _goal_progress_made(self, before: Dict, after: Dict, action: str) -> bool:
+    def _goal_progress_made(self, before: Dict, after: Dict, action_kinds: FrozenSet[str]) -> bool:
         """Check if progress was made toward the goal."""
-        # Handle cases where before/after might be strings instead of dicts
-        if not isinstance(before, dict):
-            before = {'url': str(before) if before else '', 'elements': []}
-        if not isinstance(after, dict):
-            after = {'url': str(after) if after else '', 'elements': []}
-            
         # This is a simplified check - in practice, this would be more sophisticated
-        after_text = after.get('text', '').lower()
-        
-        if 'click' in action:
-            return any(indicator in after_text for indicators in self.success_indicators.values() 
-                      for indicator in indicators)
+        if 'click' in action_kinds:
+            return self._success_indicator_scanner.found_in(after.get('text', ''))
         
         return False
     
     def _error_occurred(self, before: Dict, after: Dict) -> bool:
         """Check if an error occurred."""
-        # Handle case where after might be a string instead of dict
-        if isinstance(after, str):
-            after = {'url': '', 'elements': [], 'text': after}
-        
-        after_text = after.get('text', '').lower()
-        error_keywords = ['error', 'failed', 'invalid', 'incorrect', 'not found']
-        return any(keyword in after_text for keyword in error_keywords)
+        return _PAGE_ERROR_SCANNER.found_in(after.get('text', ''))
     
     def _element_clearly_identified(self, action: str, state: Dict) -> bool:
         """Check if the target element was clearly identified."""
         # Look for specific selectors in the action
-        return bool(re.search(r'(id=|class=|xpath=|css=)', action))
+        return _SELECTOR_RE.search(action) is not None
     
     def _input_field_available(self, action: str, state: Dict) -> bool:
         """Check if input field is available for typing."""
-        # Handle case where state might be a string instead of dict
-        if isinstance(state, str):
-            state = {'url': '', 'elements': [], 'text': state}
-        
         # Simplified check - would be more sophisticated in practice
         elements = state.get('elements', [])
         input_elements = [el for el in elements if 'input' in str(el).lower()]
@@ -435,24 +552,17 @@ class SelfCritiqueSystem:
     
     def get_performance_summary(self) -> Dict[str, Any]:
         """Get a summary of performance metrics."""
-        total_actions = sum(len(history) for history in self.effectiveness_history.values())
-        
-        if total_actions == 0:
+        if self._total_actions == 0:
             return {'message': 'No actions evaluated yet'}
         
-        avg_effectiveness = sum(
-            sum(history) / len(history) for history in self.effectiveness_history.values()
-        ) / len(self.effectiveness_history)
-        
         return {
-            'total_actions_evaluated': total_actions,
-            'average_effectiveness': avg_effectiveness,
-            'action_types_analyzed': len(self.effectiveness_history),
+            'total_actions_evaluated': self._total_actions,
+            'average_effectiveness': self._mean_effectiveness_sum / len(self._effectiveness_totals),
+            'action_types_analyzed': len(self._effectiveness_totals),
             'common_error_patterns': dict(self.error_patterns),
-            'top_performing_actions': {
-                action: rate for action, rate in 
-                sorted(self.action_success_rates.items(), key=lambda x: x[1], reverse=True)[:5]
-            }
+            'top_performing_actions': dict(
+                heapq.nlargest(5, self.action_success_rates.items(), key=operator.itemgetter(1))
+            )
         }
 
 
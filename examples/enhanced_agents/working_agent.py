@@ -1,75 +1,289 @@
 import dataclasses
 import re
-from typing import Dict, Tuple, Optional
+from collections import OrderedDict
+from typing import Dict, Tuple, Optional, Union
+from urllib.parse import urlsplit
 from agisdk import REAL
 
+# selectolax is optional; without it pages are scanned with the regexes below.
+# selectolax 1.0 removed the Modest backend (selectolax.parser), so lexbor comes first.
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser
+        SELECTOLAX_AVAILABLE = True
+    except ImportError:
+        SELECTOLAX_AVAILABLE = False
+
+# Compiled once at import; the extractors below run over the page HTML every step.
+# HTML patterns are bytes patterns: the page is encoded once per step and only the
+# small captured groups are decoded back to str.
+_BID_RE = re.compile(rb'bid="([^"]+)"[^>]*>([^<]*)', re.IGNORECASE)
+
+# Input elements with search-related attributes, in priority order
+_SEARCH_INPUT_ATTRS = (
+    rb'type="search"',
+    rb'placeholder="[^"]*[Ss]earch',
+    rb'name="[^"]*search',
+    rb'id="[^"]*search',
+)
+_SEARCH_INPUT_RES = [
+    re.compile(rb'<input[^>]*bid="([^"]+)"[^>]*' + attr, re.IGNORECASE)
+    for attr in _SEARCH_INPUT_ATTRS
+]
+# Any of the above; finds the first candidate (or none) in a single scan
+_ANY_SEARCH_INPUT_RE = re.compile(
+    rb'<input[^>]*bid="[^"]+"[^>]*(?:' + rb'|'.join(_SEARCH_INPUT_ATTRS) + rb')',
+    re.IGNORECASE
+)
+
+# Search textbox in the accessibility tree
+_AX_SEARCH_RE = re.compile(r'browsergym_id_(\w+)[^"]*textbox[^"]*search', re.IGNORECASE)
+
+# Buttons, links, and other clickable elements in one alternation; each match
+# captures its bid in the group for its kind (button, a, div, span) and then the text
+_CLICKABLE_RE = re.compile(
+    rb'<(?:button[^>]*bid="([^"]+)"'
+    rb'|a[^>]*bid="([^"]+)"'
+    rb'|div[^>]*bid="([^"]+)"[^>]*role="button"'
+    rb'|span[^>]*bid="([^"]+)"[^>]*onclick)'
+    rb'[^>]*>([^<]*)',
+    re.IGNORECASE
+)
+_CLICKABLE_KIND_COUNT = 4
+
+# Search-result check on the results page (matched in place, without lowercasing the page)
+_LAPTOP_RE = re.compile('laptop', re.IGNORECASE)
+_RESULT_MARKER_RE = re.compile('vilva|product', re.IGNORECASE)
+
+# Action templates, bound once; call with the target bid
+_FILL_LAPTOP = 'fill("{}", "laptop")'.format
+_CLICK = 'click("{}")'.format
+_PRESS_ENTER = 'press("{}", "Enter")'.format
+
+# Parsed pages remembered per agent (repeat observations during scroll / page-settle steps)
+_PARSE_CACHE_SIZE = 8
+
+
+def _html_bytes(html_content: Union[str, bytes]) -> bytes:
+    """Return the HTML as UTF-8 bytes for the bytes patterns above."""
+    if isinstance(html_content, bytes):
+        return html_content
+    return html_content.encode('utf-8', 'ignore')
+
+
+def _decode(value: bytes) -> str:
+    return value.decode('utf-8', 'replace')
+
+
+def _find_ax_search_bid(axtree_content: str) -> Optional[str]:
+    """Find a search textbox bid in the accessibility tree text."""
+    if "textbox" in axtree_content.lower() and "search" in axtree_content.lower():
+        match = _AX_SEARCH_RE.search(axtree_content)
+        if match:
+            return match.group(1)
+    return None
+
+
+def _short_label(content: str) -> Optional[str]:
+    """Return the stripped text if it is non-empty and short, else None."""
+    content = content.strip()
+    return content if 0 < len(content) < 50 else None  # Avoid very long content
+
+
+def _merge_clickables(clickable_by_kind) -> Dict[str, str]:
+    """Merge per-kind {bid: label} dicts in kind order (buttons, links, divs, spans)."""
+    clickable = {}
+    for kind_clickable in clickable_by_kind:
+        clickable.update(kind_clickable)
+    return clickable
+
+
+def _attr_after(attrs, name: str, test) -> bool:
+    """True if an attribute whose name ends with `name` passes `test` on its value.
+    
+    The regexes match the attribute text anywhere after bid, so a suffix match on
+    the name (data-type for type) counts too; valueless attributes never match.
+    """
+    return any(key.endswith(name) and value is not None and test(value.lower()) for key, value in attrs)
+
+
+def _clickable_kind(tag: str) -> Optional[int]:
+    """Kind index of a tag, by the same prefix rule as _CLICKABLE_RE (<a also matches <abbr)."""
+    if tag.startswith('button'):
+        return 0
+    if tag.startswith('a'):
+        return 1
+    if tag.startswith('div'):
+        return 2
+    if tag.startswith('span'):
+        return 3
+    return None
+
+
+def _parse_html_dom(html_content: str) -> Tuple[Optional[str], Dict[str, str]]:
+    """Search input bid and clickable elements from a single selectolax pass over [bid] nodes.
+    
+    Applies the regex extractors' rules on parsed attributes: tag names match by
+    prefix, the search/role/onclick attributes must come after bid, and labels
+    are the raw text right after the opening tag. It still differs from the
+    regexes on markup they misread or the parser repairs:
+    - labels with entities other than &amp; &lt; &gt; &nbsp;, or with a raw '>'
+      or non-breaking space, come back normalized;
+    - bid attributes with other prefixes (data-bid), unquoted or single-quoted
+      values, values containing '>' and duplicate attributes;
+    - tags inside comments or <script>, and elements the parser moves or clones
+      when repairing malformed HTML.
+    """
+    search_bids = [None] * len(_SEARCH_INPUT_ATTRS)
+    clickable_by_kind = [{} for _ in range(_CLICKABLE_KIND_COUNT)]
+    
+    for node in HTMLParser(html_content).css('[bid]'):
+        # Attribute names come back lowercased, in source order
+        attrs = list(node.attributes.items())
+        bid_index = next(i for i, (key, _) in enumerate(attrs) if key == 'bid')
+        bid = attrs[bid_index][1]
+        if not bid:
+            continue
+        after = attrs[bid_index + 1:]
+        tag = node.tag
+        
+        if tag.startswith('input'):
+            # Same priority order as _SEARCH_INPUT_ATTRS
+            for priority, matched in enumerate((
+                _attr_after(after, 'type', lambda value: value == 'search'),
+                _attr_after(after, 'placeholder', lambda value: 'search' in value),
+                _attr_after(after, 'name', lambda value: 'search' in value),
+                _attr_after(after, 'id', lambda value: 'search' in value),
+            )):
+                if matched and search_bids[priority] is None:
+                    search_bids[priority] = bid
+            continue
+        
+        kind = _clickable_kind(tag)
+        if kind is None:
+            continue
+        if kind == 2 and not _attr_after(after, 'role', lambda value: value == 'button'):
+            continue
+        if kind == 3 and not any('onclick' in key or 'onclick' in (value or '').lower() for key, value in after):
+            continue
+        # Text directly after the opening tag, like the regexes' ([^<]*) group; <area>
+        # is void, so that text is its next sibling. .html keeps the text as written
+        # (&amp; stays &amp;) where text() would decode it
+        text_node = node.next if tag == 'area' else node.child
+        label = _short_label(text_node.html if text_node is not None and text_node.tag == '-text' else '')
+        if label:
+            clickable_by_kind[kind][bid] = label
+    
+    search_input_bid = next((bid for bid in search_bids if bid is not None), None)
+    return search_input_bid, _merge_clickables(clickable_by_kind)
+
+
+def _page_key(url: str) -> Tuple[str, str]:
+    """(host, path) of a URL, identifying a page layout across visits."""
+    parts = urlsplit(url)
+    return parts.netloc, parts.path
+
 
 class WorkingAgent(REAL.Agent):
+    # (host, path) -> search input bid found there; shared by all agents in the process
+    _search_bid_cache: Dict[Tuple[str, str], str] = {}
+    
     def __init__(self) -> None:
         super().__init__()
         self.steps = 0
         self.search_input_bid = None
         self.search_completed = False
+        # hash of (pruned_html, axtree_txt) -> (search input bid, clickable elements), LRU
+        self._parse_cache = OrderedDict()
         
-    def extract_bids_from_html(self, html_content: str) -> Dict[str, str]:
-        """Extract bid attributes from HTML content"""
+    def extract_bids_from_html(self, html_content: Union[str, bytes]) -> Dict[str, str]:
+        """Extract bid attributes from HTML content (elements with short text labels only)"""
         bids = {}
-        # Look for bid attributes in HTML elements
-        bid_pattern = r'bid="([^"]+)"[^>]*>([^<]*)'
-        matches = re.findall(bid_pattern, html_content, re.IGNORECASE)
-        
-        for bid, content in matches:
-            content = content.strip()
-            if content:
-                bids[bid] = content
+        # Look for bid attributes in HTML elements, keeping short labels as for clickables
+        for match in _BID_RE.finditer(_html_bytes(html_content)):
+            label = _short_label(_decode(match.group(2)))
+            if label:
+                bids[_decode(match.group(1))] = label
                 
         return bids
         
-    def find_search_input_bid(self, html_content: str, axtree_content: str) -> Optional[str]:
+    def find_search_input_bid(self, html_content: Union[str, bytes], axtree_content: str) -> Optional[str]:
         """Find the bid of the search input field"""
-        # Look for input elements with search-related attributes
-        search_patterns = [
-            r'<input[^>]*bid="([^"]+)"[^>]*type="search"',
-            r'<input[^>]*bid="([^"]+)"[^>]*placeholder="[^"]*[Ss]earch',
-            r'<input[^>]*bid="([^"]+)"[^>]*name="[^"]*search',
-            r'<input[^>]*bid="([^"]+)"[^>]*id="[^"]*search',
-        ]
-        
-        for pattern in search_patterns:
-            match = re.search(pattern, html_content, re.IGNORECASE)
-            if match:
-                return match.group(1)
+        html_content = _html_bytes(html_content)
+        
+        # Look for input elements with search-related attributes. No pattern can match
+        # before the first candidate, so the priority scans start there (and are
+        # skipped entirely when the page has no candidate).
+        candidate = _ANY_SEARCH_INPUT_RE.search(html_content)
+        if candidate:
+            for pattern in _SEARCH_INPUT_RES:
+                match = pattern.search(html_content, candidate.start())
+                if match:
+                    return _decode(match.group(1))
                 
         # Also check accessibility tree for search inputs
-        if "textbox" in axtree_content.lower() and "search" in axtree_content.lower():
-            # Extract bid from accessibility tree
-            ax_pattern = r'browsergym_id_(\w+)[^"]*textbox[^"]*search'
-            match = re.search(ax_pattern, axtree_content, re.IGNORECASE)
-            if match:
-                return match.group(1)
-                
-        return None
+        return _find_ax_search_bid(axtree_content)
         
-    def find_clickable_elements(self, html_content: str) -> Dict[str, str]:
+    def find_clickable_elements(self, html_content: Union[str, bytes]) -> Dict[str, str]:
         """Find clickable elements with their bids"""
-        clickable = {}
-        
-        # Look for buttons, links, and other clickable elements
-        patterns = [
-            r'<button[^>]*bid="([^"]+)"[^>]*>([^<]*)',
-            r'<a[^>]*bid="([^"]+)"[^>]*>([^<]*)',
-            r'<div[^>]*bid="([^"]+)"[^>]*role="button"[^>]*>([^<]*)',
-            r'<span[^>]*bid="([^"]+)"[^>]*onclick[^>]*>([^<]*)',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, html_content, re.IGNORECASE)
-            for bid, content in matches:
-                content = content.strip()
-                if content and len(content) < 50:  # Avoid very long content
-                    clickable[bid] = content
-                    
-        return clickable
+        html_content = _html_bytes(html_content)
+        
+        # Look for buttons, links, and other clickable elements in a single scan,
+        # grouping matches by kind so buttons come first, then links, divs, spans
+        clickable_by_kind = [{} for _ in range(_CLICKABLE_KIND_COUNT)]
+        for match in _CLICKABLE_RE.finditer(html_content):
+            *kind_bids, content = match.groups()
+            for kind, bid in enumerate(kind_bids):
+                if bid is not None:
+                    label = _short_label(_decode(content))
+                    if label:
+                        clickable_by_kind[kind][_decode(bid)] = label
+                    break
+        
+        return _merge_clickables(clickable_by_kind)
+        
+    def remembered_search_input_bid(self, url: str, html_content: Union[str, bytes]) -> Optional[str]:
+        """Return the search input bid learned on this page before, if it still marks a search input."""
+        bid = self._search_bid_cache.get(_page_key(url))
+        if not bid:
+            return None
+        # Bids are dense sequential ids, so the bid being present says nothing about
+        # which element carries it now; its input tag must still match a search pattern
+        tag = re.search(rb'<input[^>]*bid="' + re.escape(bid.encode('utf-8')) + rb'"[^>]*>',
+                        _html_bytes(html_content), re.IGNORECASE)
+        if tag and _ANY_SEARCH_INPUT_RE.match(tag.group(0)):
+            return bid
+        return None
+        
+    def parse_page(self, html_content: str, axtree_content: str) -> Tuple[Optional[str], Dict[str, str]]:
+        """Return the search input bid and, when there is none, the clickable elements.
+        
+        Results are cached per page content, so an unchanged page is not re-scanned.
+        """
+        key = hash((html_content, axtree_content))
+        cached = self._parse_cache.get(key)
+        if cached is not None:
+            self._parse_cache.move_to_end(key)
+            return cached
+        
+        if SELECTOLAX_AVAILABLE and isinstance(html_content, str):
+            search_input_bid, clickable = _parse_html_dom(html_content)
+            search_input_bid = search_input_bid or _find_ax_search_bid(axtree_content)
+            if search_input_bid:
+                clickable = {}  # Not looked for on the regex path either
+        else:
+            # Encoded once for the extractors' bytes patterns
+            html_bytes = _html_bytes(html_content)
+            search_input_bid = self.find_search_input_bid(html_bytes, axtree_content)
+            clickable = {} if search_input_bid else self.find_clickable_elements(html_bytes)
+        
+        self._parse_cache[key] = parsed = (search_input_bid, clickable)
+        if len(self._parse_cache) > _PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+        return parsed
         
     def get_action(self, obs: dict) -> Tuple[str, Dict]:
         """
@@ -86,21 +300,27 @@ class WorkingAgent(REAL.Agent):
         
         # Step 1: Find search input if we haven't already
         if not self.search_input_bid and not self.search_completed:
-            self.search_input_bid = self.find_search_input_bid(html_content, axtree_content)
+            # Reuse the bid learned on this page in an earlier task before scanning the HTML
+            self.search_input_bid = self.remembered_search_input_bid(current_url, html_content)
+            if self.search_input_bid:
+                clickable = {}
+            else:
+                self.search_input_bid, clickable = self.parse_page(html_content, axtree_content)
+                if self.search_input_bid:
+                    self._search_bid_cache[_page_key(current_url)] = self.search_input_bid
             
             if self.search_input_bid:
                 print(f"Found search input with bid: {self.search_input_bid}")
                 # Fill the search input with "laptop"
-                return f'fill("{self.search_input_bid}", "laptop")', {}
+                return _FILL_LAPTOP(self.search_input_bid), {}
             else:
                 print("No search input found, looking for clickable elements...")
-                clickable = self.find_clickable_elements(html_content)
                 
                 # Look for search-related clickable elements
                 for bid, content in clickable.items():
                     if "search" in content.lower():
                         print(f"Clicking search element: {content} (bid: {bid})")
-                        return f'click("{bid}")', {}
+                        return _CLICK(bid), {}
                         
                 # If no search elements found, scroll down to look for more
                 if self.steps < 5:
@@ -110,11 +330,11 @@ class WorkingAgent(REAL.Agent):
         elif self.search_input_bid and not self.search_completed:
             print("Pressing Enter to execute search...")
             self.search_completed = True
-            return f'press("{self.search_input_bid}", "Enter")', {}
+            return _PRESS_ENTER(self.search_input_bid), {}
             
         # Step 3: Look for search results
         elif self.search_completed:
-            if "laptop" in html_content.lower() and ("vilva" in html_content.lower() or "product" in html_content.lower()):
+            if _LAPTOP_RE.search(html_content) and _RESULT_MARKER_RE.search(html_content):
                 print("Found search results! Task completed.")
                 return 'send_msg_to_user("I found the search results for laptop. The first product shown is the VILVA Portable-Monitor-for-Laptop.")', {}
             else:
@@ -137,6 +357,46 @@ class WorkingAgentArgs(REAL.AbstractAgentArgs):
         return WorkingAgent()
 
 
+# Pages the selectolax and regex paths of parse_page must read the same way
+_PARITY_SAMPLE_PAGES = (
+    '<form><input bid="12" type="text" placeholder="Search products"><button bid="13">Go</button></form>',
+    '<input type="search" bid="3"><input bid="4" name="q_search" type="search"><input bid="5" id="site-search">',
+    '<button bid="1">A &amp; B</button><a bid="2" href="/deals">&nbsp;Deals</a><abbr bid="3">Info</abbr>',
+    '<div bid="7" role="button">Add to cart</div><div role="button" bid="8">Skipped</div>',
+    '<span bid="9" onclick="buy()">Buy now</span><span onclick="x()" bid="10">Skipped</span>',
+    '<map><area bid="11" href="/a">Area text</map><article bid="12">Laptop</article>',
+    '<BUTTON BID="14">  Upper  </BUTTON><button bid="15"><i>icon</i>Label</button><p bid="16">Not clickable</p>',
+    '<button bid="17">' + 'x' * 60 + '</button><a bid="18"></a><a bid="19">Résumé ü</a>',
+)
+
+
+def test_parse_parity():
+    """Check that the selectolax and regex paths of parse_page agree on the sample pages"""
+    global SELECTOLAX_AVAILABLE
+    if not SELECTOLAX_AVAILABLE:
+        print("selectolax not installed; only the regex path is available")
+        return True
+    
+    agent = WorkingAgent()
+    mismatches = 0
+    try:
+        for page in _PARITY_SAMPLE_PAGES:
+            results = []
+            for use_dom in (True, False):
+                SELECTOLAX_AVAILABLE = use_dom
+                agent._parse_cache.clear()
+                search_input_bid, clickable = agent.parse_page(page, "")
+                results.append((search_input_bid, list(clickable.items())))
+            if results[0] != results[1]:
+                mismatches += 1
+                print(f"❌ Mismatch on {page!r}: selectolax={results[0]} regex={results[1]}")
+    finally:
+        SELECTOLAX_AVAILABLE = True
+    
+    print(f"Parse parity: {len(_PARITY_SAMPLE_PAGES) - mismatches}/{len(_PARITY_SAMPLE_PAGES)} sample pages match")
+    return mismatches == 0
+
+
 def test_working_agent():
     """Test the working agent on omnizon-1 task"""
     print("=" * 50)
@@ -177,4 +437,5 @@ def test_working_agent():
 
 
 if __name__ == "__main__":
+    test_parse_parity()
     test_working_agent()
\ No newline at end of file
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import re
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -8,6 +9,13 @@ from agisdk.REAL.browsergym.experiments import EnvArgs, ExpArgs, get_exp_result,
 from agisdk.REAL.browsergym.experiments.loop import ExpResult, yield_all_exp_results
 from agisdk.REAL.browsergym.experiments.agent import Agent
 
+# Node fields that may carry the element's BID, in lookup order
+_BID_FIELDS = ('browsergym_id', 'bid', 'backendDOMNodeId', 'nodeId')
+
+# Keywords marking a search textbox / search button, matched against lowercased names
+_SEARCH_TEXTBOX_RE = re.compile(r'search|find|query')
+_SEARCH_BUTTON_RE = re.compile(r'search|find|submit')
+
 
 @dataclass
 class WorkingSearchAgentArgs(AbstractAgentArgs):
@@ -71,94 +79,110 @@ class WorkingSearchAgent(Agent):
                 nodes = axtree_obj['nodes']
                 print(f"Total nodes: {len(nodes)}")
                 
-                # Find interactive elements with proper BID extraction
-                interactive_elements = []
-                search_elements = []
-                textbox_elements = []
-                button_elements = []
+                # Find textboxes and buttons with proper BID extraction, in one pass.
+                # Each category is kept as parallel lists of node index, name, and BID.
+                textbox_idx, textbox_names, textbox_bids = [], [], []
+                button_idx, button_names, button_bids = [], [], []
+                search_idx, search_roles, search_names, search_bids = [], [], [], []
+                first_search_textbox = first_search_button = None
                 
                 for i, node in enumerate(nodes):
-                    if isinstance(node, dict):
-                        role_str = self.extract_role(node.get('role', {})).lower()
-                        name_str = self.extract_name(node.get('name', {})).lower()
-                        
-                        # Get the actual BID - try different possible field names
-                        bid = None
-                        for bid_field in ['browsergym_id', 'bid', 'backendDOMNodeId', 'nodeId']:
-                            if bid_field in node:
-                                bid = str(node[bid_field])
-                                break
-                        
-                        if not bid:
-                            continue
-                            
-                        # Categorize elements
-                        if role_str == 'textbox':
-                            textbox_elements.append((i, node, role_str, name_str, bid))
-                            if any(keyword in name_str for keyword in ['search', 'find', 'query']):
-                                search_elements.append((i, node, role_str, name_str, bid))
-                        elif role_str == 'button':
-                            button_elements.append((i, node, role_str, name_str, bid))
-                            if any(keyword in name_str for keyword in ['search', 'find', 'submit']):
-                                search_elements.append((i, node, role_str, name_str, bid))
-                        elif role_str in ['link', 'searchbox', 'combobox']:
-                            interactive_elements.append((i, node, role_str, name_str, bid))
+                    if not isinstance(node, dict):
+                        continue
+                    
+                    # Only textboxes and buttons are acted on; skip other roles before the BID/name work.
+                    # Role and name are extracted inline (same rules as extract_role/extract_name).
+                    role = node.get('role', {})
+                    if isinstance(role, dict):
+                        role = role['value'] if 'value' in role else role['type'] if 'type' in role else str(role)
+                    else:
+                        role = str(role)
+                    role_str = role.lower()
+                    if role_str != 'textbox' and role_str != 'button':
+                        continue
+                    
+                    # Get the actual BID - try different possible field names
+                    for bid_field in _BID_FIELDS:
+                        if bid_field in node:
+                            bid = str(node[bid_field])
+                            break
+                    else:
+                        continue
+                    if not bid:
+                        continue
+                    
+                    name = node.get('name', {})
+                    if isinstance(name, dict):
+                        name = name['value'] if 'value' in name else name['name'] if 'name' in name else str(name)
+                    else:
+                        name = str(name)
+                    name_str = name.lower()
+                    
+                    # Categorize elements
+                    if role_str == 'textbox':
+                        is_search = _SEARCH_TEXTBOX_RE.search(name_str) is not None
+                        if is_search and first_search_textbox is None:
+                            first_search_textbox = len(textbox_bids)
+                        textbox_idx.append(i)
+                        textbox_names.append(name_str)
+                        textbox_bids.append(bid)
+                    else:
+                        is_search = _SEARCH_BUTTON_RE.search(name_str) is not None
+                        if is_search and first_search_button is None:
+                            first_search_button = len(button_bids)
+                        button_idx.append(i)
+                        button_names.append(name_str)
+                        button_bids.append(bid)
+                    
+                    if is_search:
+                        search_idx.append(i)
+                        search_roles.append(role_str)
+                        search_names.append(name_str)
+                        search_bids.append(bid)
                 
-                print(f"Found {len(textbox_elements)} textbox elements")
-                print(f"Found {len(button_elements)} button elements")
-                print(f"Found {len(search_elements)} search-related elements")
+                print(f"Found {len(textbox_bids)} textbox elements")
+                print(f"Found {len(button_bids)} button elements")
+                print(f"Found {len(search_bids)} search-related elements")
                 
                 # Show what we found
-                if textbox_elements:
+                if textbox_bids:
                     print(f"\nTextbox elements:")
-                    for i, (node_idx, node, role, name, bid) in enumerate(textbox_elements[:3]):
+                    for i, (node_idx, name, bid) in enumerate(zip(textbox_idx[:3], textbox_names, textbox_bids)):
                         print(f"  {i+1}. Node {node_idx}: name='{name}', bid='{bid}'")
                 
-                if button_elements:
+                if button_bids:
                     print(f"\nButton elements:")
-                    for i, (node_idx, node, role, name, bid) in enumerate(button_elements[:3]):
+                    for i, (node_idx, name, bid) in enumerate(zip(button_idx[:3], button_names, button_bids)):
                         print(f"  {i+1}. Node {node_idx}: name='{name}', bid='{bid}'")
                 
-                if search_elements:
+                if search_bids:
                     print(f"\nSearch-related elements:")
-                    for i, (node_idx, node, role, name, bid) in enumerate(search_elements):
+                    for i, (node_idx, role, name, bid) in enumerate(zip(search_idx, search_roles, search_names, search_bids)):
                         print(f"  {i+1}. Node {node_idx}: role='{role}', name='{name}', bid='{bid}'")
                 
                 # Try to perform search action
                 if not self.search_attempted:
-                    # Look for a search textbox first
-                    search_textbox = None
-                    for node_idx, node, role, name, bid in textbox_elements:
-                        if any(keyword in name.lower() for keyword in ['search', 'find', 'query']):
-                            search_textbox = (node_idx, node, role, name, bid)
-                            break
+                    # Look for a search textbox first; if there is none, try any textbox
+                    textbox = first_search_textbox
+                    if textbox is None and textbox_bids:
+                        textbox = 0
                     
-                    # If no explicit search textbox, try any textbox
-                    if not search_textbox and textbox_elements:
-                        search_textbox = textbox_elements[0]
-                    
-                    if search_textbox:
-                        node_idx, node, role, name, bid = search_textbox
+                    if textbox is not None:
+                        name, bid = textbox_names[textbox], textbox_bids[textbox]
                         print(f"\nAttempting to type 'laptop' in textbox: {name} (bid: {bid})")
                         self.search_attempted = True
                         return f'type(bid="{bid}", text="laptop")', {}
                     
                     # If no textbox, try clicking a search button
-                    search_button = None
-                    for node_idx, node, role, name, bid in button_elements:
-                        if any(keyword in name.lower() for keyword in ['search', 'find', 'submit']):
-                            search_button = (node_idx, node, role, name, bid)
-                            break
-                    
-                    if search_button:
-                        node_idx, node, role, name, bid = search_button
+                    if first_search_button is not None:
+                        name, bid = button_names[first_search_button], button_bids[first_search_button]
                         print(f"\nAttempting to click search button: {name} (bid: {bid})")
                         self.search_attempted = True
                         return f'click(bid="{bid}")', {}
                     
                     # If no specific search elements, try any button
-                    if button_elements:
-                        node_idx, node, role, name, bid = button_elements[0]
+                    if button_bids:
+                        name, bid = button_names[0], button_bids[0]
                         print(f"\nAttempting to click first button: {name} (bid: {bid})")
                         self.search_attempted = True
                         return f'click(bid="{bid}")', {}
@@ -9,6 +9,29 @@ Make sure to set your REAL_API_KEY environment variable before running.
 import os
 from agisdk import REAL
 
+# psutil is optional; without it the worker count is not checked against free memory
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# Upper bound on parallel browsers unless AGISDK_MAX_WORKERS overrides it
+DEFAULT_MAX_WORKERS = 16
+# Free memory to keep per worker (one headless Chromium each), in GB
+MEMORY_PER_WORKER_GB = 1
+
+def choose_num_workers():
+    """One worker per CPU core, capped by AGISDK_MAX_WORKERS (default 16) and by free memory."""
+    max_workers = int(os.getenv("AGISDK_MAX_WORKERS", DEFAULT_MAX_WORKERS))
+    num_workers = min(os.cpu_count() or 4, max_workers)
+    
+    if PSUTIL_AVAILABLE:
+        available_gb = psutil.virtual_memory().available / 1024 ** 3
+        num_workers = min(num_workers, int(available_gb // MEMORY_PER_WORKER_GB))
+    
+    return max(1, num_workers)
+
 def submit_to_leaderboard():
     """Submit agent results to the REAL benchmark leaderboard"""
     
@@ -23,6 +46,8 @@ def submit_to_leaderboard():
     print("🚀 Starting REAL Benchmark Leaderboard Submission...")
     print(f"📊 Using API Key: {api_key[:8]}...")
     
+    num_workers = choose_num_workers()
+    
     # Configure harness for leaderboard submission
     harness = REAL.harness(
         # Model configuration
@@ -39,7 +64,7 @@ def submit_to_leaderboard():
         # task_name="webclones.omnizon-1",        # Uncomment to run specific task
         
         # Execution options
-        num_workers=4,                            # Parallel execution for speed
+        num_workers=num_workers,                  # Parallel execution for speed
         headless=True,                            # Run without browser GUI
         max_steps=25,                             # Maximum steps per task
         
@@ -62,7 +87,7 @@ def submit_to_leaderboard():
     print(f"   • Model: Claude 3.5 Sonnet")
     print(f"   • Run Name: Claude-3.5-Sonnet Enhanced Agent v1.0")
     print(f"   • Tasks: All 112 REAL benchmark tasks")
-    print(f"   • Workers: 4 parallel")
+    print(f"   • Workers: {num_workers} parallel")
     print(f"   • Results Dir: ./leaderboard_results")
     
     # Run the evaluation
@@ -11,9 +11,15 @@ multi-step workflows, and sophisticated browser interactions.
 import os
 import time
 import json
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from nova_act import NovaAct
 from typing import Dict, Any, List
 
+# Demos are independent and network/LLM bound, so they run side by side
+DEMO_WORKERS = 4
+
 
 class NovaCapabilitiesDemo:
     """Demonstrates advanced Nova Act capabilities"""
@@ -21,37 +27,74 @@ class NovaCapabilitiesDemo:
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.results = []
+        self._lock = threading.Lock()
+        # One browser session per thread (a browser can't run two demos at once),
+        # started by the thread's first demo, see _open()
+        self._local = threading.local()
+    
+    def _open(self, url: str) -> NovaAct:
+        """Return the calling thread's Nova Act session, navigated to url.
+        
+        Starting a session launches a browser, so it is done once per thread and
+        later demos on that thread just navigate the same session.
+        """
+        nova = getattr(self._local, 'nova', None)
+        if nova is None:
+            nova = NovaAct(starting_page=url, nova_act_api_key=self.api_key)
+            nova.start()
+            self._local.nova = nova
+        else:
+            nova.go_to_url(url)
+        return nova
+    
+    def close(self):
+        """Stop the calling thread's Nova Act session, if one was started"""
+        nova = getattr(self._local, 'nova', None)
+        if nova is not None:
+            self._local.nova = None
+            nova.stop()
+    
+    def _discard_session(self):
+        """Drop the calling thread's session after a failed demo.
+        
+        The browser or driver may have died with it, so the thread's next demo
+        starts a fresh session instead of failing in go_to_url.
+        """
+        try:
+            self.close()
+        except Exception as e:
+            print(f"⚠️ Failed to stop Nova Act session: {e}")
     
     def log_result(self, demo_name: str, result: Any, success: bool = True):
         """Log demo results"""
-        self.results.append({
-            'demo': demo_name,
-            'success': success,
-            'result': str(result)[:200] + '...' if len(str(result)) > 200 else str(result),
-            'timestamp': time.time()
-        })
         status = "✅" if success else "❌"
-        print(f"{status} {demo_name}: {result}")
+        with self._lock:
+            self.results.append({
+                'demo': demo_name,
+                'success': success,
+                'result': str(result)[:200] + '...' if len(str(result)) > 200 else str(result),
+                'timestamp': time.time()
+            })
+            print(f"{status} {demo_name}: {result}")
     
     def demo_complex_navigation(self):
         """Demo: Complex multi-step navigation and data extraction"""
         print("\n🌐 Demo: Complex Navigation & Data Extraction")
         
         try:
-            with NovaAct(starting_page="https://news.ycombinator.com", 
-                        nova_act_api_key=self.api_key) as nova:
-                
-                # Multi-step task: Navigate, find, click, extract
-                result = nova.act("""
-                1. Find the top story on Hacker News
-                2. Click on it to read the full article
-                3. Extract the article title, author (if available), and first paragraph
-                4. Return this information in a structured format
-                """)
-                
-                self.log_result("Complex Navigation", result.response)
+            nova = self._open(url="https://news.ycombinator.com")
+            # Multi-step task: Navigate, find, click, extract
+            result = nova.act("""
+            1. Find the top story on Hacker News
+            2. Click on it to read the full article
+            3. Extract the article title, author (if available), and first paragraph
+            4. Return this information in a structured format
+            """)
+            
+            self.log_result("Complex Navigation", result.response)
                 
         except Exception as e:
+            self._discard_session()
             self.log_result("Complex Navigation", f"Error: {e}", False)
     
     def demo_form_automation(self):
@@ -59,25 +102,24 @@ class NovaCapabilitiesDemo:
         print("\n📝 Demo: Advanced Form Automation")
         
         try:
-            with NovaAct(starting_page="https://httpbin.org/forms/post", 
-                        nova_act_api_key=self.api_key) as nova:
-                
-                result = nova.act("""
-                Fill out this form with the following information:
-                - Customer Name: John Doe
-                - Telephone: +1-555-0123
-                - Email: john.doe@example.com
-                - Size: Large
-                - Topping: Pepperoni
-                - Delivery Time: 7:00 PM
-                - Comments: Please ring the doorbell twice
-                
-                Then submit the form and return the response details.
-                """)
-                
-                self.log_result("Form Automation", result.response)
+            nova = self._open(url="https://httpbin.org/forms/post")
+            result = nova.act("""
+            Fill out this form with the following information:
+            - Customer Name: John Doe
+            - Telephone: +1-555-0123
+            - Email: john.doe@example.com
+            - Size: Large
+            - Topping: Pepperoni
+            - Delivery Time: 7:00 PM
+            - Comments: Please ring the doorbell twice
+            
+            Then submit the form and return the response details.
+            """)
+            
+            self.log_result("Form Automation", result.response)
                 
         except Exception as e:
+            self._discard_session()
             self.log_result("Form Automation", f"Error: {e}", False)
     
     def demo_ecommerce_workflow(self):
@@ -85,23 +127,22 @@ class NovaCapabilitiesDemo:
         print("\n🛒 Demo: E-commerce Shopping Workflow")
         
         try:
-            with NovaAct(starting_page="https://demo.opencart.com", 
-                        nova_act_api_key=self.api_key) as nova:
-                
-                result = nova.act("""
-                Simulate a shopping experience:
-                1. Search for "laptop" in the search bar
-                2. Browse the first few results
-                3. Click on a laptop that costs between $500-$1000
-                4. Add it to the cart
-                5. View the cart contents
-                6. Extract the product name, price, and cart total
-                7. Return this information without actually purchasing
-                """)
-                
-                self.log_result("E-commerce Workflow", result.response)
+            nova = self._open(url="https://demo.opencart.com")
+            result = nova.act("""
+            Simulate a shopping experience:
+            1. Search for "laptop" in the search bar
+            2. Browse the first few results
+            3. Click on a laptop that costs between $500-$1000
+            4. Add it to the cart
+            5. View the cart contents
+            6. Extract the product name, price, and cart total
+            7. Return this information without actually purchasing
+            """)
+            
+            self.log_result("E-commerce Workflow", result.response)
                 
         except Exception as e:
+            self._discard_session()
             self.log_result("E-commerce Workflow", f"Error: {e}", False)
     
     def demo_data_extraction(self):
@@ -109,20 +150,19 @@ class NovaCapabilitiesDemo:
         print("\n📊 Demo: Advanced Data Extraction")
         
         try:
-            with NovaAct(starting_page="https://en.wikipedia.org/wiki/List_of_countries_by_population", 
-                        nova_act_api_key=self.api_key) as nova:
-                
-                result = nova.act("""
-                Extract information about the top 10 most populous countries:
-                1. Find the main population table
-                2. Extract the country name, population, and percentage of world population
-                3. Format this as a structured list
-                4. Also note the data source and last update date if available
-                """)
-                
-                self.log_result("Data Extraction", result.response)
+            nova = self._open(url="https://en.wikipedia.org/wiki/List_of_countries_by_population")
+            result = nova.act("""
+            Extract information about the top 10 most populous countries:
+            1. Find the main population table
+            2. Extract the country name, population, and percentage of world population
+            3. Format this as a structured list
+            4. Also note the data source and last update date if available
+            """)
+            
+            self.log_result("Data Extraction", result.response)
                 
         except Exception as e:
+            self._discard_session()
             self.log_result("Data Extraction", f"Error: {e}", False)
     
     def demo_social_media_interaction(self):
@@ -130,21 +170,20 @@ class NovaCapabilitiesDemo:
         print("\n📱 Demo: Social Media Interactions")
         
         try:
-            with NovaAct(starting_page="https://jsonplaceholder.typicode.com", 
-                        nova_act_api_key=self.api_key) as nova:
-                
-                result = nova.act("""
-                Explore this API documentation site:
-                1. Navigate to the posts section
-                2. Find information about how to create a new post
-                3. Look for user management features
-                4. Extract the main API endpoints available
-                5. Summarize the key features of this API service
-                """)
-                
-                self.log_result("Social Media Interactions", result.response)
+            nova = self._open(url="https://jsonplaceholder.typicode.com")
+            result = nova.act("""
+            Explore this API documentation site:
+            1. Navigate to the posts section
+            2. Find information about how to create a new post
+            3. Look for user management features
+            4. Extract the main API endpoints available
+            5. Summarize the key features of this API service
+            """)
+            
+            self.log_result("Social Media Interactions", result.response)
                 
         except Exception as e:
+            self._discard_session()
             self.log_result("Social Media Interactions", f"Error: {e}", False)
     
     def demo_search_and_compare(self):
@@ -152,21 +191,20 @@ class NovaCapabilitiesDemo:
         print("\n🔍 Demo: Search & Compare")
         
         try:
-            with NovaAct(starting_page="https://www.google.com", 
-                        nova_act_api_key=self.api_key) as nova:
-                
-                result = nova.act("""
-                Research Python web frameworks:
-                1. Search for "Python web frameworks comparison"
-                2. Click on a comprehensive comparison article or resource
-                3. Extract information about Django, Flask, and FastAPI
-                4. Compare their key features, pros, and cons
-                5. Provide a summary recommendation for different use cases
-                """)
-                
-                self.log_result("Search & Compare", result.response)
+            nova = self._open(url="https://www.google.com")
+            result = nova.act("""
+            Research Python web frameworks:
+            1. Search for "Python web frameworks comparison"
+            2. Click on a comprehensive comparison article or resource
+            3. Extract information about Django, Flask, and FastAPI
+            4. Compare their key features, pros, and cons
+            5. Provide a summary recommendation for different use cases
+            """)
+            
+            self.log_result("Search & Compare", result.response)
                 
         except Exception as e:
+            self._discard_session()
             self.log_result("Search & Compare", f"Error: {e}", False)
     
     def demo_dynamic_content(self):
@@ -174,20 +212,19 @@ class NovaCapabilitiesDemo:
         print("\n⚡ Demo: Dynamic Content Handling")
         
         try:
-            with NovaAct(starting_page="https://httpbin.org", 
-                        nova_act_api_key=self.api_key) as nova:
-                
-                result = nova.act("""
-                Explore this HTTP testing service:
-                1. Navigate to different endpoints (like /json, /xml, /html)
-                2. Test a few HTTP methods if there are interactive examples
-                3. Extract sample responses from different endpoints
-                4. Summarize what this service is used for and its main features
-                """)
-                
-                self.log_result("Dynamic Content", result.response)
+            nova = self._open(url="https://httpbin.org")
+            result = nova.act("""
+            Explore this HTTP testing service:
+            1. Navigate to different endpoints (like /json, /xml, /html)
+            2. Test a few HTTP methods if there are interactive examples
+            3. Extract sample responses from different endpoints
+            4. Summarize what this service is used for and its main features
+            """)
+            
+            self.log_result("Dynamic Content", result.response)
                 
         except Exception as e:
+            self._discard_session()
             self.log_result("Dynamic Content", f"Error: {e}", False)
     
     def demo_multi_tab_workflow(self):
@@ -195,22 +232,21 @@ class NovaCapabilitiesDemo:
         print("\n🗂️ Demo: Multi-tab Workflow")
         
         try:
-            with NovaAct(starting_page="https://www.github.com", 
-                        nova_act_api_key=self.api_key) as nova:
-                
-                result = nova.act("""
-                Explore GitHub's trending repositories:
-                1. Go to the trending page
-                2. Find the top trending Python repository
-                3. Click on it to view details
-                4. Extract: repository name, description, stars, language, and recent activity
-                5. Go back and check one more trending repository
-                6. Compare the two repositories and provide insights
-                """)
-                
-                self.log_result("Multi-tab Workflow", result.response)
+            nova = self._open(url="https://www.github.com")
+            result = nova.act("""
+            Explore GitHub's trending repositories:
+            1. Go to the trending page
+            2. Find the top trending Python repository
+            3. Click on it to view details
+            4. Extract: repository name, description, stars, language, and recent activity
+            5. Go back and check one more trending repository
+            6. Compare the two repositories and provide insights
+            """)
+            
+            self.log_result("Multi-tab Workflow", result.response)
                 
         except Exception as e:
+            self._discard_session()
             self.log_result("Multi-tab Workflow", f"Error: {e}", False)
     
     def demo_accessibility_features(self):
@@ -218,21 +254,20 @@ class NovaCapabilitiesDemo:
         print("\n♿ Demo: Accessibility Features")
         
         try:
-            with NovaAct(starting_page="https://www.w3.org/WAI/", 
-                        nova_act_api_key=self.api_key) as nova:
-                
-                result = nova.act("""
-                Explore web accessibility resources:
-                1. Navigate to accessibility guidelines or standards
-                2. Find information about WCAG (Web Content Accessibility Guidelines)
-                3. Extract key principles of web accessibility
-                4. Look for practical examples or tools mentioned
-                5. Summarize the main accessibility recommendations
-                """)
-                
-                self.log_result("Accessibility Features", result.response)
+            nova = self._open(url="https://www.w3.org/WAI/")
+            result = nova.act("""
+            Explore web accessibility resources:
+            1. Navigate to accessibility guidelines or standards
+            2. Find information about WCAG (Web Content Accessibility Guidelines)
+            3. Extract key principles of web accessibility
+            4. Look for practical examples or tools mentioned
+            5. Summarize the main accessibility recommendations
+            """)
+            
+            self.log_result("Accessibility Features", result.response)
                 
         except Exception as e:
+            self._discard_session()
             self.log_result("Accessibility Features", f"Error: {e}", False)
     
     def demo_api_interaction(self):
@@ -240,21 +275,20 @@ class NovaCapabilitiesDemo:
         print("\n🔌 Demo: API Interaction")
         
         try:
-            with NovaAct(starting_page="https://reqres.in", 
-                        nova_act_api_key=self.api_key) as nova:
-                
-                result = nova.act("""
-                Explore this API testing service:
-                1. Look at the available API endpoints
-                2. Find examples of GET, POST, PUT, DELETE requests
-                3. Extract sample request and response formats
-                4. Test one of the interactive examples if available
-                5. Summarize the API capabilities and use cases
-                """)
-                
-                self.log_result("API Interaction", result.response)
+            nova = self._open(url="https://reqres.in")
+            result = nova.act("""
+            Explore this API testing service:
+            1. Look at the available API endpoints
+            2. Find examples of GET, POST, PUT, DELETE requests
+            3. Extract sample request and response formats
+            4. Test one of the interactive examples if available
+            5. Summarize the API capabilities and use cases
+            """)
+            
+            self.log_result("API Interaction", result.response)
                 
         except Exception as e:
+            self._discard_session()
             self.log_result("API Interaction", f"Error: {e}", False)
     
     def run_all_demos(self):
@@ -275,15 +309,40 @@ class NovaCapabilitiesDemo:
             self.demo_api_interaction
         ]
         
+        pending = queue.Queue()
         for demo in demos:
-            try:
-                demo()
-                time.sleep(2)  # Brief pause between demos
-            except Exception as e:
-                print(f"❌ Demo failed: {e}")
+            pending.put(demo)
+        
+        with ThreadPoolExecutor(max_workers=DEMO_WORKERS) as executor:
+            workers = [executor.submit(self._demo_worker, pending) for _ in range(DEMO_WORKERS)]
+            for worker in workers:
+                try:
+                    worker.result()
+                except Exception as e:
+                    print(f"⚠️ Failed to stop Nova Act session: {e}")
         
         self.print_summary()
     
+    def _demo_worker(self, pending: queue.Queue):
+        """Run demos from the queue until it is empty, on one browser session.
+        
+        The session is stopped by the thread that started it, as the browser
+        driver is bound to that thread.
+        """
+        try:
+            while True:
+                try:
+                    demo = pending.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    demo()
+                except Exception as e:
+                    self._discard_session()
+                    print(f"❌ Demo failed: {e}")
+        finally:
+            self.close()
+    
     def print_summary(self):
         """Print a summary of all demo results"""
         print("\n" + "=" * 60)
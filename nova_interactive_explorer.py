@@ -23,6 +23,8 @@ class NovaInteractiveExplorer:
         self.current_url = "https://www.google.com"
         self.session_history = []
         self.bookmarks = {}
+        # Browser session kept open for the whole explorer run, see _open()
+        self._nova = None
         
     def print_banner(self):
         """Print the welcome banner"""
@@ -78,26 +80,48 @@ System Commands:
         """
         print(help_text)
     
+    def _open(self) -> NovaAct:
+        """Return the explorer's Nova Act session, navigated to the current URL.
+        
+        The browser is started on the first command and reused afterwards, so
+        each command only pays for a page load instead of a browser launch.
+        """
+        if self._nova is None:
+            self._nova = NovaAct(starting_page=self.current_url, nova_act_api_key=self.api_key)
+            self._nova.start()
+        else:
+            self._nova.go_to_url(self.current_url)
+        return self._nova
+    
+    def close(self):
+        """Stop the Nova Act session, if one was started"""
+        nova, self._nova = self._nova, None
+        if nova is not None:
+            nova.stop()
+    
     def execute_nova_command(self, instruction: str, **kwargs) -> Optional[str]:
         """Execute a Nova Act command with the given instruction"""
         try:
-            with NovaAct(starting_page=self.current_url, 
-                        nova_act_api_key=self.api_key) as nova:
-                
-                result = nova.act(instruction, **kwargs)
-                
-                # Log to history
-                self.session_history.append({
-                    'timestamp': time.time(),
-                    'url': self.current_url,
-                    'instruction': instruction,
-                    'result': result.response[:200] + '...' if len(str(result.response)) > 200 else result.response
-                })
-                
-                return result.response
+            nova = self._open()
+            result = nova.act(instruction, **kwargs)
+            
+            # Log to history
+            self.session_history.append({
+                'timestamp': time.time(),
+                'url': self.current_url,
+                'instruction': instruction,
+                'result': result.response[:200] + '...' if len(str(result.response)) > 200 else result.response
+            })
+            
+            return result.response
                 
         except Exception as e:
             print(f"❌ Error: {e}")
+            # The browser or driver may have died with the command; start the next one fresh
+            try:
+                self.close()
+            except Exception as close_error:
+                print(f"⚠️ Failed to stop Nova Act session: {close_error}")
             return None
     
     def handle_go_command(self, url: str):
@@ -266,81 +290,84 @@ System Commands:
         """Run the main interactive session"""
         self.print_banner()
         
-        while True:
-            try:
-                # Get user input
-                user_input = input("\n🤖 Nova> ").strip()
+        try:
+            while True:
+                try:
+                    # Get user input
+                    user_input = input("\n🤖 Nova> ").strip()
                 
-                if not user_input:
-                    continue
+                    if not user_input:
+                        continue
                 
-                # Parse command
-                parts = user_input.split(' ', 1)
-                command = parts[0].lower()
-                args = parts[1] if len(parts) > 1 else ""
+                    # Parse command
+                    parts = user_input.split(' ', 1)
+                    command = parts[0].lower()
+                    args = parts[1] if len(parts) > 1 else ""
                 
-                # Handle commands
-                if command == 'quit' or command == 'exit':
-                    print("👋 Goodbye! Thanks for exploring Nova Act!")
-                    break
+                    # Handle commands
+                    if command == 'quit' or command == 'exit':
+                        print("👋 Goodbye! Thanks for exploring Nova Act!")
+                        break
                 
-                elif command == 'help':
-                    self.print_help()
+                    elif command == 'help':
+                        self.print_help()
                 
-                elif command == 'clear':
-                    os.system('clear' if os.name == 'posix' else 'cls')
-                    self.print_banner()
+                    elif command == 'clear':
+                        os.system('clear' if os.name == 'posix' else 'cls')
+                        self.print_banner()
                 
-                elif command == 'go':
-                    if args:
-                        self.handle_go_command(args)
-                    else:
-                        print("❌ Usage: go <url>")
+                    elif command == 'go':
+                        if args:
+                            self.handle_go_command(args)
+                        else:
+                            print("❌ Usage: go <url>")
                 
-                elif command == 'demo':
-                    if args:
-                        self.handle_demo_command(args)
-                    else:
-                        print("❌ Usage: demo <category>")
-                        print("Available: ecommerce, news, forms, research, social, data")
+                    elif command == 'demo':
+                        if args:
+                            self.handle_demo_command(args)
+                        else:
+                            print("❌ Usage: demo <category>")
+                            print("Available: ecommerce, news, forms, research, social, data")
                 
-                elif command == 'bookmark':
-                    if args:
-                        self.add_bookmark(args)
-                    else:
-                        print("❌ Usage: bookmark <name>")
+                    elif command == 'bookmark':
+                        if args:
+                            self.add_bookmark(args)
+                        else:
+                            print("❌ Usage: bookmark <name>")
                 
-                elif command == 'bookmarks':
-                    self.show_bookmarks()
+                    elif command == 'bookmarks':
+                        self.show_bookmarks()
                 
-                elif command == 'history':
-                    self.show_history()
+                    elif command == 'history':
+                        self.show_history()
                 
-                elif command == 'current':
-                    self.show_current_info()
+                    elif command == 'current':
+                        self.show_current_info()
                 
-                elif command in ['search', 'click', 'type', 'scroll', 'extract', 
-                               'form', 'compare', 'analyze', 'workflow']:
-                    if args:
-                        print(f"🔄 Executing {command} command...")
-                        result = self.execute_nova_command(f"{command.title()}: {args}")
+                    elif command in ['search', 'click', 'type', 'scroll', 'extract', 
+                                   'form', 'compare', 'analyze', 'workflow']:
+                        if args:
+                            print(f"🔄 Executing {command} command...")
+                            result = self.execute_nova_command(f"{command.title()}: {args}")
+                            if result:
+                                print(f"✅ Result: {result}")
+                        else:
+                            print(f"❌ Usage: {command} <instructions>")
+                
+                    else:
+                        # Treat as general Nova Act instruction
+                        print("🔄 Executing custom instruction...")
+                        result = self.execute_nova_command(user_input)
                         if result:
                             print(f"✅ Result: {result}")
-                    else:
-                        print(f"❌ Usage: {command} <instructions>")
                 
-                else:
-                    # Treat as general Nova Act instruction
-                    print("🔄 Executing custom instruction...")
-                    result = self.execute_nova_command(user_input)
-                    if result:
-                        print(f"✅ Result: {result}")
-                
-            except KeyboardInterrupt:
-                print("\n👋 Goodbye! Thanks for exploring Nova Act!")
-                break
-            except Exception as e:
-                print(f"❌ Unexpected error: {e}")
+                except KeyboardInterrupt:
+                    print("\n👋 Goodbye! Thanks for exploring Nova Act!")
+                    break
+                except Exception as e:
+                    print(f"❌ Unexpected error: {e}")
+        finally:
+            self.close()
 
 
 def main():